@@ -4,15 +4,42 @@ from __future__ import absolute_import, print_function, unicode_literals
 from _Framework.ControlSurface import ControlSurface
 import socket
 import json
+import os
+import select
+from collections import deque
+from numbers import Integral
 import threading
 import time
 import traceback
 
-# Change queue import for Python 2
+# orjson is used when it happens to be importable from Live's interpreter;
+# the stdlib json module is the normal case and always the fallback.
 try:
-    import Queue as queue  # Python 2
+    import orjson as _orjson
 except ImportError:
-    import queue  # Python 3
+    _orjson = None
+
+# Both parse the raw received bytes and encode responses straight to a
+# newline-terminated UTF-8 line, so no str round trip sits in between.
+if _orjson is not None:
+    _json_loads = _orjson.loads
+    _JSON_LINE_OPTIONS = _orjson.OPT_NON_STR_KEYS | _orjson.OPT_APPEND_NEWLINE
+
+    def _json_line(obj):
+        try:
+            return _orjson.dumps(obj, option=_JSON_LINE_OPTIONS)
+        except TypeError:
+            # Values orjson refuses (e.g. ints beyond 64 bits) still encode
+            return (json.dumps(obj) + "\n").encode("utf-8")
+else:
+    _json_loads = json.loads
+
+    def _json_line(obj):
+        return (json.dumps(obj) + "\n").encode("utf-8")
+
+# Deadlines and cache ages must not jump with wall-clock adjustments;
+# Python 2 has no time.monotonic, so it keeps time.time there.
+_monotonic = getattr(time, "monotonic", time.time)
 
 from . import handlers
 
@@ -21,17 +48,67 @@ DEFAULT_PORT = 9877
 UDP_REALTIME_PORT = 9882
 HOST = "localhost"
 
+# Receive buffer requested for the UDP parameter socket, so a burst of
+# updates queues in the kernel instead of being dropped while the loop is
+# busy.  The OS may cap it (on Linux at net.core.rmem_max).
+UDP_RECV_BUFFER = 4 * 1024 * 1024
+
+# Initial size of each TCP client's receive buffer (bytes)
+CLIENT_RECV_BUFFER = 65536
+
+# Main-thread time (seconds) one drain of queued commands may use before
+# leaving the rest for the next tick, so a burst can't stall Live's UI.
+MAIN_THREAD_BUDGET = 0.01
+
+# Seconds a client thread waits for a queued command's result, unless the
+# command has its own limit in _COMMAND_TIMEOUTS.
+MAIN_THREAD_TIMEOUT = 10.0
+
+# Polled transport reads are answered from a copy refreshed on Live's
+# display tick (see _SNAPSHOT_COMMANDS).  A copy older than
+# SNAPSHOT_MAX_AGE seconds isn't used, and refreshing stops once nobody
+# has asked for SNAPSHOT_IDLE seconds.
+SNAPSHOT_MAX_AGE = 0.25
+SNAPSHOT_IDLE = 2.0
+
+# Encoded responses of _CACHED_READS are reused for this many seconds,
+# unless a modifying command runs first.  At most RESPONSE_CACHE_MAX
+# are kept.
+RESPONSE_CACHE_TTL = 10.0
+RESPONSE_CACHE_MAX = 64
+
+# Log a traceback for every failed command, not only unexpected ones
+# (see AbletonBridge._log_traceback).  Enable by starting Live with
+# ABLETON_BRIDGE_DEBUG=1 in its environment.
+DEBUG = os.environ.get("ABLETON_BRIDGE_DEBUG", "") not in ("", "0")
+
+_SCHEDULING_UNAVAILABLE = {
+    "status": "error",
+    "message": "Ableton scheduling unavailable — try again shortly",
+}
+_TIMEOUT = {"status": "error", "message": "Timeout waiting for operation to complete"}
+_READ_TIMEOUT = {"status": "error", "message": "Timeout waiting for read-only operation to complete"}
+
+# Answer to "ping", given on the socket thread: a liveness probe that
+# doesn't wait for Live's main thread (any other command does).
+_PONG = {"status": "success", "result": {"pong": True}}
+
 # -----------------------------------------------------------------------
 # Command dispatch tables
 # -----------------------------------------------------------------------
-# Both modifying and read-only commands are dispatched on Ableton's main
-# thread via schedule_message + queue (Live API is not thread-safe).
+# Both modifying and read-only commands run on Ableton's main thread
+# (Live API is not thread-safe): socket threads append them to a deque
+# drained by a scheduled main-thread tick, then wait on an Event for
+# the reply.
 # The distinction controls timeout behaviour and future optimisation.
 #
 # Each value is a lambda(song, p, ctrl) that extracts parameters from *p*
-# and calls the appropriate handler.  The dict keys double as the
-# MODIFYING_COMMANDS / READ_ONLY_COMMANDS membership sets used by
-# _process_command for routing.
+# and calls the appropriate handler.  Both tables are merged into
+# _DISPATCH below, which _process_command uses for routing.
+#
+# The lambdas close over nothing, so they compile to the same code a
+# generated ``def`` would; keep them inline so each command's parameter
+# extraction stays readable next to its name.
 # -----------------------------------------------------------------------
 
 _MODIFYING_HANDLERS = {
@@ -222,14 +299,17 @@ _MODIFYING_HANDLERS = {
     "duplicate_scene": lambda song, p, ctrl: handlers.scenes.duplicate_scene(song, p.get("scene_index", 0), ctrl),
     "fire_scene": lambda song, p, ctrl: handlers.scenes.fire_scene(song, p.get("scene_index", 0), ctrl),
     "set_scene_name": lambda song, p, ctrl: handlers.scenes.set_scene_name(song, p.get("scene_index", 0), p.get("name", ""), ctrl),
-    "set_scene_tempo": lambda song, p, ctrl: handlers.scenes.set_scene_tempo(song, p.get("scene_index", 0), p.get("tempo", 0), ctrl),
+    "set_scene_tempo": lambda song, p, ctrl: handlers.scenes.set_scene_tempo(song, p.get("scene_index", 0), p.get("tempo", 0), p.get("verify", False), ctrl),
     "set_scene_follow_actions": lambda song, p, ctrl: handlers.scenes.set_scene_follow_actions(
         song, p.get("scene_index", 0),
         p.get("follow_action_0"), p.get("follow_action_1"),
         p.get("follow_action_probability"), p.get("follow_action_time"),
         p.get("follow_action_enabled"), p.get("follow_action_linked"), ctrl),
     "fire_scene_as_selected": lambda song, p, ctrl: handlers.scenes.fire_scene_as_selected(song, p.get("scene_index", 0), ctrl),
-    "set_scene_color": lambda song, p, ctrl: handlers.scenes.set_scene_color(song, p.get("scene_index", 0), p.get("color_index", 0), ctrl),
+    "set_scene_color": lambda song, p, ctrl: handlers.scenes.set_scene_color(song, p.get("scene_index", 0), p.get("color_index", 0), p.get("verify", False), ctrl),
+    "update_scene": lambda song, p, ctrl: handlers.scenes.update_scene(
+        song, p.get("scene_index", 0), p.get("name"), p.get("color_index"),
+        p.get("tempo"), p.get("follow_actions"), ctrl),
 
     # --- Devices ---
     "set_device_parameter": lambda song, p, ctrl: handlers.devices.set_device_parameter(
@@ -531,7 +611,8 @@ _READONLY_HANDLERS = {
     "get_warp_markers": lambda song, p, ctrl: handlers.clips.get_warp_markers(song, p.get("track_index", 0), p.get("clip_index", 0), ctrl),
 
     # --- Arrangement ---
-    "get_arrangement_clips": lambda song, p, ctrl: handlers.arrangement.get_arrangement_clips(song, p.get("track_index", 0), ctrl),
+    "get_arrangement_clips": lambda song, p, ctrl: handlers.arrangement.get_arrangement_clips(
+        song, p.get("track_index", 0), p.get("compact", False), ctrl),
     "get_arrangement_clip_info": lambda song, p, ctrl: handlers.arrangement.get_arrangement_clip_info(
         song, p.get("track_index", 0), p.get("clip_index_in_arrangement", 0), ctrl),
 
@@ -574,6 +655,163 @@ _READONLY_HANDLERS = {
         song, p.get("track_index"), ctrl),
 }
 
+# Commands that can hold the main thread for a long time (rendering,
+# loading from disk, walking the browser).  They wait in their own queue
+# and each drain runs at most one of them, after the quick commands, so
+# a fader move never waits behind a freeze or a device load.
+_SLOW_COMMANDS = {
+    "freeze_track", "unfreeze_track", "audio_to_midi", "sliced_simpler_to_drum_rack",
+    "create_midi_track_with_simpler", "duplicate_track", "capture_midi",
+    "load_browser_item", "load_instrument_or_effect", "load_sample", "load_device_preset",
+    "set_hybrid_reverb_ir", "duplicate_time", "insert_silence", "delete_time",
+    "get_browser_tree", "get_browser_items_at_path", "search_browser",
+    "get_user_library", "get_user_folders", "get_device_presets", "analyze_audio_clip",
+}
+
+# Cheap, parameterless reads that clients poll (a transport display, a
+# playhead).  While they are being polled, update_display refreshes their
+# results on the main thread and the socket thread answers from that copy
+# without waiting for a tick.  Any modifying command invalidates it.
+_SNAPSHOT_COMMANDS = {"get_song_transport", "get_loop_info"}
+
+# Parameter types checked on the socket thread before a command is queued,
+# for the commands that carry bulk payloads: a malformed request is
+# answered at once instead of costing a main-thread tick to fail.  Only
+# listed keys that are present and not None are checked.
+_PARAM_SCHEMAS = {
+    "add_notes_to_clip": (("track_index", Integral), ("clip_index", Integral), ("notes", list)),
+    "add_notes_extended": (("track_index", Integral), ("clip_index", Integral), ("notes", list)),
+    "set_device_parameters_batch": (
+        ("track_index", Integral), ("device_index", Integral), ("parameters", list)),
+    "create_clip_automation": (
+        ("track_index", Integral), ("clip_index", Integral), ("automation_points", list)),
+    "create_track_automation": (("track_index", Integral), ("automation_points", list)),
+    "create_step_automation": (("track_index", Integral), ("clip_index", Integral), ("steps", list)),
+    "group_tracks": (("track_indices", list),),
+}
+_TYPE_NAMES = {Integral: "an integer", list: "a list"}
+
+
+def _validate_params(schema, params):
+    """Return an error message if *params* can't satisfy *schema*, else None."""
+    if not isinstance(params, dict):
+        return "Invalid params: expected an object"
+    for key, kind in schema:
+        value = params.get(key)
+        if value is not None and not isinstance(value, kind):
+            return "Invalid parameter '{0}': expected {1}".format(key, _TYPE_NAMES[kind])
+    return None
+
+
+# Continuous controls whose write depends only on the latest value.  When
+# two queued commands name the same control with nothing in between, the
+# earlier one is not run; its caller gets the response of the later one,
+# errors included, since that is what happened to the target.  A fader
+# dragged from several clients costs one Live write per tick, not one per
+# message.  Values are the params that identify the target.
+_COALESCE_TARGETS = {
+    "set_tempo": (),
+    "set_track_volume": ("track_index",),
+    "set_track_pan": ("track_index",),
+    "set_track_send": ("track_index", "send_index"),
+    "set_return_track_volume": ("return_track_index",),
+    "set_return_track_pan": ("return_track_index",),
+    "set_master_volume": (),
+    "set_crossfader": (),
+    "set_cue_volume": (),
+    "set_device_parameter": ("track_type", "track_index", "device_index", "parameter_name"),
+    "set_macro_value": ("track_type", "track_index", "device_index", "macro_index"),
+}
+
+# The fixed responses above, encoded once.  "Unknown command" names the
+# command and so can't be pre-encoded.  Keyed by id(): the dicts live as
+# long as the module.
+_FIXED_LINES = dict(
+    (id(response), _json_line(response))
+    for response in (_SCHEDULING_UNAVAILABLE, _TIMEOUT, _READ_TIMEOUT, _PONG))
+
+
+def _response_line(response):
+    """Encode *response*, reusing its _FIXED_LINES entry if it has one."""
+    line = _FIXED_LINES.get(id(response))
+    return _json_line(response) if line is None else line
+
+
+def _coalesce_key(command_type, names, params):
+    """Return the key identifying what *command_type* writes, given its
+    _COALESCE_TARGETS *names*, or None."""
+    if names is None:
+        return None
+    try:
+        key = (command_type,) + tuple(params.get(name) for name in names)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+# Per-command overrides of MAIN_THREAD_TIMEOUT for commands that
+# legitimately take longer.  Each is a little under the MCP server's
+# SLOW_COMMAND_TIMEOUTS entry (or the timeout its tool passes) so the
+# client gets this explicit error rather than a socket timeout.
+# Quick commands keep the default: their wait includes any slow task
+# running ahead of them, so a tight limit would fail them spuriously.
+_COMMAND_TIMEOUTS = {
+    "freeze_track": 55.0,
+    "unfreeze_track": 25.0,
+    "audio_to_midi": 25.0,
+    "load_instrument_or_effect": 25.0,
+    "load_sample": 25.0,
+    "create_midi_track_with_simpler": 18.0,
+    "sliced_simpler_to_drum_rack": 18.0,
+    "get_browser_items_at_path": 18.0,
+}
+
+# command -> (handler, is_modifying, is_slow, schema, coalesce_names,
+# is_snapshot, timeout): one probe per command finds the handler, which
+# timeout applies, which queue it uses and what _process_command checks
+# before queueing it, instead of a probe into each table above.
+# The keys are string literals and so already interned.  Interning the
+# decoded command name too costs a lookup in the intern table, which
+# measured slower than the plain compare it would save.
+_DISPATCH = {}
+for _table, _modifying in ((_MODIFYING_HANDLERS, True), (_READONLY_HANDLERS, False)):
+    for _name, _handler in _table.items():
+        _DISPATCH[_name] = (
+            _handler, _modifying, _name in _SLOW_COMMANDS,
+            _PARAM_SCHEMAS.get(_name, ()), _COALESCE_TARGETS.get(_name),
+            _name in _SNAPSHOT_COMMANDS,
+            _COMMAND_TIMEOUTS.get(_name, MAIN_THREAD_TIMEOUT))
+del _table, _modifying, _name, _handler
+
+
+# Browser walks whose answer rarely changes but which clients repeat (an
+# agent re-listing a folder, paging search results).  Values are the
+# params the result depends on.  Live has no listener for browser
+# contents, so besides the modifying-command check the entries expire
+# after RESPONSE_CACHE_TTL to pick up files added on disk.
+_CACHED_READS = {
+    "get_browser_tree": ("category_type",),
+    "get_browser_items_at_path": ("path",),
+    "search_browser": ("query", "category"),
+    "get_user_library": (),
+    "get_user_folders": (),
+}
+
+
+def _response_cache_key(command):
+    """Return the response-cache key for *command*, or None if not cached."""
+    try:
+        names = _CACHED_READS.get(command.get("type"))
+        params = command.get("params", {})
+        if names is None or not isinstance(params, dict):
+            return None
+        key = (command["type"],) + tuple(params.get(name) for name in names)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
 
 def create_instance(c_instance):
     """Create and return the AbletonBridge script instance"""
@@ -590,19 +828,54 @@ class AbletonBridge(ControlSurface):
 
         # Socket server for communication
         self.server = None
-        self.client_threads = []
-        self.client_sockets = []
-        self.server_thread = None
+        # Connected clients and their handler threads.  Each handler
+        # removes its own entries when it exits, so nothing has to sweep
+        # for finished threads on accept.
+        self.client_threads = set()
+        self.client_sockets = set()
+        self._clients_lock = threading.Lock()
         self.running = False
 
         # UDP real-time parameter server
         self.udp_sock = None
-        self.udp_thread = None
         self.udp_running = False
 
+        # Latest UDP parameter values waiting for the main thread, as
+        # {(track_type, track_index, device_index): {name: entry}}
+        self._udp_pending = {}
+        self._udp_lock = threading.Lock()
+        self._udp_flush_scheduled = False
+
+        # One thread accepts TCP clients and reads UDP packets; disconnect
+        # wakes it through the _wake_* socket pair
+        self.io_thread = None
+        self._wake_recv = None
+        self._wake_send = None
+
+        # TCP commands waiting for the main thread, as (task(song), skip,
+        # coalesce_key) entries, with _SLOW_COMMANDS kept apart; at most
+        # one drain of these queues is scheduled at a time.
+        # deque.append/popleft are atomic, so socket threads and the main
+        # thread share them without a lock.
+        self._pending_tasks = deque()
+        self._pending_slow_tasks = deque()
+        self._drain_lock = threading.Lock()
+        self._drain_scheduled = False
+
+        # _SNAPSHOT_COMMANDS results: command -> (time, generation, result),
+        # and when each was last asked for.  _state_generation counts the
+        # modifying commands run, so a copy taken before one is never used.
+        self._snapshots = {}
+        self._snapshot_requests = {}
+        self._state_generation = 0
+
+        # _CACHED_READS responses: key -> (time, generation, encoded line)
+        self._response_cache = {}
+
         # Start the socket servers
         self.start_server()
         self.start_udp_server()
+        self.start_io_thread()
 
         self.log_message("AbletonBridge initialized")
 
@@ -620,8 +893,19 @@ class AbletonBridge(ControlSurface):
         self.running = False
         self.udp_running = False
 
+        # Wake the I/O thread out of select() so it sees the flags
+        if self._wake_send is not None:
+            try:
+                self._wake_send.send(b"x")
+            except (OSError, socket.error):
+                pass
+
+        with self._clients_lock:
+            sockets, self.client_sockets = self.client_sockets, set()
+            threads, self.client_threads = self.client_threads, set()
+
         # Close all client sockets so their threads can exit
-        for sock in self.client_sockets[:]:
+        for sock in sockets:
             try:
                 sock.shutdown(socket.SHUT_RDWR)
             except (OSError, socket.error):
@@ -630,7 +914,6 @@ class AbletonBridge(ControlSurface):
                 sock.close()
             except (OSError, socket.error):
                 pass
-        self.client_sockets = []
 
         # Stop the server
         if self.server:
@@ -643,12 +926,8 @@ class AbletonBridge(ControlSurface):
             except (OSError, socket.error):
                 pass
 
-        # Wait for the server thread to exit
-        if self.server_thread and self.server_thread.is_alive():
-            self.server_thread.join(3.0)
-
         # Wait briefly for client threads to exit
-        for client_thread in self.client_threads[:]:
+        for client_thread in threads:
             if client_thread.is_alive():
                 client_thread.join(3.0)
 
@@ -660,220 +939,340 @@ class AbletonBridge(ControlSurface):
                 pass
             self.udp_sock = None
 
-        if self.udp_thread and self.udp_thread.is_alive():
-            self.udp_thread.join(3.0)
+        # Wait for the I/O thread to exit
+        if self.io_thread and self.io_thread.is_alive():
+            self.io_thread.join(3.0)
+        for sock in (self._wake_recv, self._wake_send):
+            if sock is not None:
+                try:
+                    sock.close()
+                except (OSError, socket.error):
+                    pass
+        self._wake_recv = self._wake_send = None
 
         ControlSurface.disconnect(self)
         self.log_message("AbletonBridge disconnected")
 
     def start_server(self):
-        """Start the socket server in a separate thread"""
+        """Open the TCP command socket (served by the I/O thread)"""
         try:
             self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server.bind((HOST, DEFAULT_PORT))
             self.server.listen(5)
+            self.server.settimeout(1.0)
 
             self.running = True
-            self.server_thread = threading.Thread(target=self._server_thread)
-            self.server_thread.daemon = True
-            self.server_thread.start()
-
             self.log_message("Server started on port " + str(DEFAULT_PORT))
         except Exception as e:
             self.log_message("Error starting server: " + str(e))
             self.show_message("AbletonBridge: Error starting server - " + str(e))
 
     def start_udp_server(self):
-        """Start the UDP real-time parameter server in a separate thread."""
+        """Open the UDP real-time parameter socket (served by the I/O thread)."""
         try:
             self.udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                self.udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RECV_BUFFER)
+            except (OSError, socket.error) as e:
+                self.log_message("UDP: could not enlarge receive buffer: " + str(e))
             self.udp_sock.bind((HOST, UDP_REALTIME_PORT))
             self.udp_sock.settimeout(1.0)
 
             self.udp_running = True
-            self.udp_thread = threading.Thread(target=self._udp_server_loop)
-            self.udp_thread.daemon = True
-            self.udp_thread.start()
-
             self.log_message("UDP real-time server started on port " + str(UDP_REALTIME_PORT))
         except Exception as e:
             self.udp_running = False
             self.log_message("Error starting UDP server: " + str(e))
 
-    def _udp_server_loop(self):
-        """UDP server loop - receives fire-and-forget parameter updates."""
-        while self.udp_running:
+    def start_io_thread(self):
+        """Start the thread serving whichever sockets opened successfully."""
+        if not (self.running or self.udp_running):
+            return
+        try:
+            self._wake_recv, self._wake_send = socket.socketpair()
+        except (AttributeError, OSError, socket.error) as e:
+            # Without the pair (Python 2 on Windows) the loop polls instead
+            self.log_message("I/O thread: no wake-up socket pair, polling: " + str(e))
+        self.io_thread = threading.Thread(target=self._io_loop)
+        self.io_thread.daemon = True
+        self.io_thread.start()
+
+    def _io_loop(self):
+        """Wait on the TCP listener and the UDP socket together.
+
+        Accepting a client and reading a UDP packet are both short, so one
+        select() loop serves the two sockets instead of a thread each.
+        Connected clients still get their own thread: each blocks while
+        its command waits for Live's main thread, and serving them from
+        this loop would need every reply to be completed, ordered and
+        timed out from here.  An idle client thread sleeps in recv() and
+        wakes every few seconds; its stack is reserved address space, not
+        memory in use.
+        """
+        self.log_message("I/O thread started")
+        wake = self._wake_recv
+        # With a wake-up socket the loop sleeps until there is work; the
+        # one-second poll only remains as the fallback without one
+        timeout = 1.0 if wake is None else None
+        while self.running or self.udp_running:
+            socks = [] if wake is None else [wake]
+            if self.running and self.server is not None:
+                socks.append(self.server)
+            if self.udp_running and self.udp_sock is not None:
+                socks.append(self.udp_sock)
             try:
-                data, addr = self.udp_sock.recvfrom(4096)
-                if not data:
-                    continue
+                ready = select.select(socks, [], [], timeout)[0]
+            except (select.error, socket.error, ValueError) as e:
+                # A socket closed under us by disconnect() lands here too
+                if self.running or self.udp_running:
+                    self.log_message("I/O thread select error: " + str(e))
+                    time.sleep(0.1)
+                continue
 
-                try:
-                    command = json.loads(data.decode("utf-8"))
-                except (ValueError, UnicodeDecodeError) as parse_err:
-                    self.log_message(
-                        "UDP: malformed packet from {0}: {1}".format(addr, parse_err))
-                    continue
+            for sock in ready:
+                if sock is wake:
+                    break
+                if sock is self.server:
+                    self._accept_client()
+                elif sock is self.udp_sock:
+                    self._read_udp_packet()
+        self.log_message("I/O thread stopped")
+
+    def _read_udp_packet(self):
+        """Read and apply one fire-and-forget parameter update."""
+        try:
+            data, addr = self.udp_sock.recvfrom(4096)
+            if not data:
+                return
 
-                self._process_udp_command(command)
+            try:
+                command = _json_loads(data)
+            except (ValueError, TypeError) as parse_err:
+                self.log_message(
+                    "UDP: malformed packet from {0}: {1}".format(addr, parse_err))
+                return
 
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if self.udp_running:
-                    self.log_message("UDP server error: " + str(e))
-                time.sleep(0.1)
+            self._process_udp_command(command)
+
+        except socket.timeout:
+            return
+        except Exception as e:
+            if self.udp_running:
+                self.log_message("UDP server error: " + str(e))
 
     def _process_udp_command(self, command):
         """Process a UDP command. Fire-and-forget - no response sent.
 
-        IMPORTANT: This runs on the UDP thread.  Do NOT access self._song
-        here — the Live API is not thread-safe.  Instead, capture only the
-        plain-data cmd/params on this thread and defer all Live API access
-        (including self._song) to the scheduled task that runs on the main
-        thread.  If schedule_message fails, drop the update with a log
-        message rather than calling the task inline from the wrong thread.
+        IMPORTANT: This runs on the I/O thread.  Do NOT access self._song
+        here — the Live API is not thread-safe.  Instead, merge only the
+        plain-data params into _udp_pending on this thread and defer all
+        Live API access (including self._song) to _flush_udp_params, which
+        runs on the main thread.  If schedule_message fails, drop the
+        updates with a log message rather than applying them inline from
+        the wrong thread.
         """
         cmd = command.get("type", "")
         params = command.get("params", {})
+        if not isinstance(params, dict):
+            return
 
         if cmd == "set_device_parameter":
-            def task():
-                try:
-                    handlers.devices.set_device_parameter(
-                        self._song,
-                        params.get("track_index", 0),
-                        params.get("device_index", 0),
-                        params.get("parameter_name", ""),
-                        params.get("value", 0.0),
-                        params.get("track_type", "track"),
-                        ctrl=self,
-                    )
-                except Exception as e:
-                    self.log_message("UDP set_device_parameter error: " + str(e))
-            try:
-                self.schedule_message(0, task)
-            except AssertionError:
-                self.log_message("UDP set_device_parameter: schedule_message unavailable, dropping update")
-
+            entries = ({"name": params.get("parameter_name", ""),
+                        "value": params.get("value", 0.0)},)
         elif cmd == "batch_set_device_parameters":
-            def task():
-                try:
-                    handlers.devices.set_device_parameters_batch(
-                        self._song,
-                        params.get("track_index", 0),
-                        params.get("device_index", 0),
-                        params.get("parameters", []),
-                        params.get("track_type", "track"),
-                        ctrl=self,
-                    )
-                except Exception as e:
-                    self.log_message("UDP batch_set error: " + str(e))
+            entries = params.get("parameters", [])
+        else:
+            return
+        device_key = (params.get("track_type", "track"),
+                      params.get("track_index", 0),
+                      params.get("device_index", 0))
+
+        # Reject a malformed packet here, before it can raise under the
+        # lock and leave earlier merged updates without a scheduled flush
+        try:
+            if not isinstance(entries, (list, tuple)):
+                raise TypeError("parameters is not a list")
+            names = [entry.get("name", "") for entry in entries]
+            hash(device_key)
+            hash(tuple(names))
+        except (AttributeError, TypeError) as e:
+            self.log_message("UDP parameter update: malformed {0} dropped ({1})".format(cmd, e))
+            return
+
+        with self._udp_lock:
+            pending = self._udp_pending.get(device_key)
+            if pending is None:
+                pending = self._udp_pending[device_key] = {}
+            for name, entry in zip(names, entries):
+                # A later value for the same parameter replaces the earlier one
+                pending[name] = entry
+            if self._udp_flush_scheduled:
+                return
+            self._udp_flush_scheduled = True
+        try:
+            self.schedule_message(0, self._flush_udp_params)
+        except AssertionError:
+            with self._udp_lock:
+                self._udp_pending = {}
+                self._udp_flush_scheduled = False
+            self.log_message("UDP parameter update: schedule_message unavailable, dropping updates")
+
+    def _flush_udp_params(self):
+        """Apply the latest UDP value of every pending parameter (main thread).
+
+        Updates that arrived since the last flush are applied together per
+        device, so a controller flood costs one device lookup per device
+        per tick instead of one scheduled task per packet.  A failing
+        entry is logged without dropping the others (see
+        apply_parameter_values).
+        """
+        with self._udp_lock:
+            pending = self._udp_pending
+            self._udp_pending = {}
+            self._udp_flush_scheduled = False
+        song = self._song
+        for (track_type, track_index, device_index), entries in pending.items():
             try:
-                self.schedule_message(0, task)
-            except AssertionError:
-                self.log_message("UDP batch_set: schedule_message unavailable, dropping update")
+                handlers.devices.apply_parameter_values(
+                    song, track_index, device_index, entries.values(),
+                    track_type, ctrl=self)
+            except Exception as e:
+                self.log_message("UDP parameter update error: " + str(e))
 
-    def _server_thread(self):
-        """Server thread implementation - handles client connections"""
+    def _accept_client(self):
+        """Accept one pending connection and start its handler thread"""
         try:
-            self.log_message("Server thread started")
-            self.server.settimeout(1.0)
-
-            while self.running:
-                try:
-                    client, address = self.server.accept()
-                    self.log_message("Connection accepted from " + str(address))
-                    self.show_message("AbletonBridge: Client connected")
-
-                    client_thread = threading.Thread(
-                        target=self._handle_client,
-                        args=(client,)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-
-                    self.client_threads.append(client_thread)
-                    self.client_sockets.append(client)
-
-                    # Clean up finished client threads
-                    self.client_threads = [t for t in self.client_threads if t.is_alive()]
-
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    if self.running:
-                        self.log_message("Server accept error: " + str(e))
-                    time.sleep(0.5)
-
-            self.log_message("Server thread stopped")
+            client, address = self.server.accept()
+        except socket.timeout:
+            return
         except Exception as e:
-            self.log_message("Server thread error: " + str(e))
+            if self.running:
+                self.log_message("Server accept error: " + str(e))
+            return
+
+        self.log_message("Connection accepted from " + str(address))
+        # Each response is one small write; send it immediately
+        # rather than letting Nagle hold it for the client's ACK.
+        # Buffer sizes are left to the kernel's autotuning.
+        try:
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (OSError, socket.error):
+            pass
+        self.show_message("AbletonBridge: Client connected")
+
+        # One daemon thread per connection, not a pool (see _io_loop)
+        client_thread = threading.Thread(
+            target=self._handle_client,
+            args=(client,)
+        )
+        client_thread.daemon = True
+        # Registered before it starts, so its own removal can't come first
+        with self._clients_lock:
+            self.client_threads.add(client_thread)
+            self.client_sockets.add(client)
+        client_thread.start()
 
     def _handle_client(self, client):
-        """Handle communication with a connected client"""
+        """Handle communication with a connected client
+
+        The per-message work here (recv_into, find, parse, encode, sendall)
+        already runs in C; a whole loopback round trip through this loop
+        with an immediately-run handler takes ~50us, against a main-thread
+        wait of a Live tick for every command.
+        """
         self.log_message("Client handler started")
         client.settimeout(5.0)
-        buffer = ''
+        # Received bytes go straight into one reusable buffer; it only
+        # grows for a message larger than it (bounded by the 1MB limit).
+        buffer = bytearray(CLIENT_RECV_BUFFER)
+        view = memoryview(buffer)
+        filled = 0  # bytes of buffer holding received data
+        start = 0   # end of the lines already taken from buffer
 
         try:
             while self.running:
                 try:
+                    # Keep only the unconsumed tail, at the front
+                    if start:
+                        buffer[:filled - start] = buffer[start:filled]
+                        filled -= start
+                        start = 0
+                    if filled == len(buffer):
+                        # A bytearray can't grow while a view of it exists
+                        view = None
+                        buffer.extend(bytearray(len(buffer)))
+                        view = memoryview(buffer)
+
                     try:
-                        data = client.recv(8192)
+                        # Usually every line was consumed and the read
+                        # starts at the front: no slice object needed
+                        received = client.recv_into(view[filled:] if filled else view)
                     except socket.timeout:
                         continue
 
-                    if not data:
+                    if not received:
                         self.log_message("Client disconnected")
                         break
 
-                    # Accumulate data (replace invalid UTF-8 instead of crashing)
-                    buffer += data.decode('utf-8', errors='replace')
-
-                    # Process all complete newline-delimited messages
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        line = line.strip()
+                    # Only the new bytes can hold a newline: the buffered
+                    # tail was already searched.  Lines are cut out in place
+                    # and the consumed prefix dropped once per recv, rather
+                    # than re-splitting the remainder for every message.
+                    # Parsing whole lines also keeps a UTF-8 character split
+                    # across two reads intact.
+                    scan_from = filled
+                    filled += received
+                    end = buffer.find(b'\n', scan_from, filled)
+                    while end >= 0:
+                        # The parser skips surrounding whitespace itself, so
+                        # the line is only stripped if it fails to parse
+                        line = buffer[start:end]
+                        start = end + 1
+                        end = buffer.find(b'\n', start, filled)
                         if not line:
                             continue
 
                         try:
-                            command = json.loads(line)
-                        except ValueError:
-                            self.log_message("Invalid JSON received, skipping: " + line[:100])
-                            continue
+                            command = _json_loads(line)
+                        except (ValueError, TypeError):
+                            # Replace invalid UTF-8 instead of dropping the line
+                            line = line.decode('utf-8', 'replace').strip()
+                            if not line:
+                                continue
+                            try:
+                                command = _json_loads(line)
+                            except ValueError:
+                                self.log_message("Invalid JSON received, skipping: " + line[:100])
+                                continue
 
                         self.log_message("Received command: " + str(command.get("type", "unknown")))
 
-                        response = self._process_command(command)
-
-                        response_str = json.dumps(response) + '\n'
+                        payload = self._encoded_response(command)
                         try:
-                            client.sendall(response_str.encode('utf-8'))
+                            client.sendall(payload)
                         except (OSError, socket.error):
                             self.log_message("Client disconnected during response send")
                             break
 
                     # 1MB safety limit
-                    if len(buffer) > 1048576:
+                    if filled - start > 1048576:
                         self.log_message("Buffer overflow (>1MB without newline), disconnecting client")
                         try:
-                            err = json.dumps({"status": "error", "message": "Request too large (>1MB)"}) + '\n'
-                            client.sendall(err.encode('utf-8'))
+                            client.sendall(_json_line(
+                                {"status": "error", "message": "Request too large (>1MB)"}))
                         except Exception:
                             pass
                         break
 
                 except Exception as e:
                     self.log_message("Error handling client data: " + str(e))
-                    self.log_message(traceback.format_exc())
+                    self._log_traceback(e)
 
                     error_response = {"status": "error", "message": self._safe_error_message(e)}
                     try:
-                        client.sendall((json.dumps(error_response) + '\n').encode('utf-8'))
+                        client.sendall(_json_line(error_response))
                     except Exception:
                         break
 
@@ -890,10 +1289,9 @@ class AbletonBridge(ControlSurface):
                 client.close()
             except (OSError, socket.error):
                 pass
-            try:
-                self.client_sockets.remove(client)
-            except ValueError:
-                pass
+            with self._clients_lock:
+                self.client_sockets.discard(client)
+                self.client_threads.discard(threading.current_thread())
             self.log_message("Client handler stopped")
 
     # ------------------------------------------------------------------
@@ -914,10 +1312,19 @@ class AbletonBridge(ControlSurface):
             return "Missing required parameter: {0}".format(e)
         if isinstance(e, TypeError):
             return "Invalid parameter type"
-        if isinstance(e, queue.Empty):
-            return "Operation timed out"
         return "Internal error - check Ableton log for details"
 
+    def _log_traceback(self, e):
+        """Log the traceback of the exception being handled.
+
+        Input errors (bad index, bad value, missing key) already carry a
+        clear message back to the client, and a misbehaving client can
+        produce them in bulk, so their tracebacks are only formatted when
+        DEBUG is set.
+        """
+        if DEBUG or not isinstance(e, (ValueError, IndexError, KeyError)):
+            self.log_message(traceback.format_exc())
+
     # ------------------------------------------------------------------
     # Command routing
     # ------------------------------------------------------------------
@@ -929,73 +1336,198 @@ class AbletonBridge(ControlSurface):
         response = {"status": "success", "result": {}}
 
         try:
-            if command_type in _MODIFYING_HANDLERS:
-                response = self._dispatch_on_main_thread(command_type, params)
-            elif command_type in _READONLY_HANDLERS:
-                response = self._dispatch_on_main_thread_readonly(command_type, params)
-            else:
+            entry = _DISPATCH.get(command_type)
+            error = None if entry is None else _validate_params(entry[3], params)
+            if entry is None:
+                if command_type == "ping":
+                    return _PONG
                 response["status"] = "error"
                 response["message"] = "Unknown command: " + command_type
+            elif error is not None:
+                response = {"status": "error", "message": error}
+            elif entry[1]:
+                response = self._dispatch_on_main_thread(
+                    entry, params, _coalesce_key(command_type, entry[4], params))
+            else:
+                response = None
+                if entry[5]:
+                    response = self._read_snapshot(command_type)
+                if response is None:
+                    response = self._dispatch_on_main_thread(entry, params)
         except Exception as e:
             self.log_message("Error processing command: " + str(e))
-            self.log_message(traceback.format_exc())
-            response["status"] = "error"
-            response["message"] = self._safe_error_message(e)
+            self._log_traceback(e)
+            # A fresh dict: response may already be a shared fixed one
+            response = {"status": "error", "message": self._safe_error_message(e)}
 
         return response
 
-    def _dispatch_on_main_thread_impl(self, dispatch_fn, command_type, params, timeout_msg):
-        """Schedule a command on Ableton's main thread and wait for the result."""
-        response_queue = queue.Queue()
-
-        def main_thread_task():
+    def _encoded_response(self, command):
+        """Return the UTF-8 response line for *command*, reusing a cached
+        one for _CACHED_READS when it is still valid."""
+        key = _response_cache_key(command)
+        if key is None:
+            return _response_line(self._process_command(command))
+
+        now = _monotonic()
+        generation = self._state_generation
+        cached = self._response_cache.get(key)
+        if (cached is not None and cached[1] == generation
+                and now - cached[0] < RESPONSE_CACHE_TTL):
+            return cached[2]
+
+        response = self._process_command(command)
+        payload = _response_line(response)
+        if response.get("status") == "success":
+            if len(self._response_cache) >= RESPONSE_CACHE_MAX:
+                self._response_cache.clear()
+            self._response_cache[key] = (now, generation, payload)
+        return payload
+
+    def _dispatch_on_main_thread(self, entry, params, coalesce_key=None):
+        """Run a _DISPATCH *entry* on Ableton's main thread and wait for the result.
+
+        Commands with a *coalesce_key* may be skipped if the next queued
+        command has the same key, and then share its response (see
+        _COALESCE_TARGETS).  Slow commands
+        go to the separate queue described at _SLOW_COMMANDS.
+        """
+        handler, modifying, slow = entry[0], entry[1], entry[2]
+        # One response, handed over once: an Event plus a slot is much
+        # cheaper to create and signal than a Queue
+        done = threading.Event()
+        box = [None]
+
+        def main_thread_task(song):
+            if modifying:
+                self._state_generation += 1
             try:
-                result = dispatch_fn(command_type, params)
-                response_queue.put({"status": "success", "result": result})
+                # ctrl stays positional; a keyword-bound partial is slower
+                result = handler(song, params, self)
+                box[0] = {"status": "success", "result": result}
             except Exception as e:
                 self.log_message("Error in main thread task: " + str(e))
-                self.log_message(traceback.format_exc())
-                response_queue.put({"status": "error", "message": self._safe_error_message(e)})
-
-        try:
-            self.schedule_message(0, main_thread_task)
-        except AssertionError:
-            self.log_message("TCP command: schedule_message unavailable, returning error")
-            return {"status": "error", "message": "Ableton scheduling unavailable — try again shortly"}
+                self._log_traceback(e)
+                box[0] = {"status": "error", "message": self._safe_error_message(e)}
+            done.set()
+            return box[0]
 
-        try:
-            return response_queue.get(timeout=10.0)
-        except queue.Empty:
-            return {"status": "error", "message": timeout_msg}
+        def skip(response=_SCHEDULING_UNAVAILABLE):
+            box[0] = response
+            done.set()
 
-    def _dispatch_on_main_thread(self, command_type, params):
-        return self._dispatch_on_main_thread_impl(
-            self._dispatch_modifying, command_type, params,
-            "Timeout waiting for operation to complete")
+        if slow:
+            self._pending_slow_tasks.append((main_thread_task, skip, None))
+        else:
+            self._pending_tasks.append((main_thread_task, skip, coalesce_key))
+        self._schedule_drain()
 
-    def _dispatch_on_main_thread_readonly(self, command_type, params):
-        return self._dispatch_on_main_thread_impl(
-            self._dispatch_read_only, command_type, params,
-            "Timeout waiting for read-only operation to complete")
+        if done.wait(entry[6]):
+            return box[0]
+        return _TIMEOUT if modifying else _READ_TIMEOUT
 
     # ------------------------------------------------------------------
-    # Modifying command dispatch
+    # Snapshot reads
     # ------------------------------------------------------------------
 
-    def _dispatch_modifying(self, cmd, p):
-        """Route a modifying command to the appropriate handler function."""
-        handler = _MODIFYING_HANDLERS.get(cmd)
-        if handler is None:
-            raise ValueError("Unknown modifying command: {0}".format(cmd))
-        return handler(self._song, p, self)
+    def _read_snapshot(self, command_type):
+        """Return a response from the current snapshot of *command_type*, or None."""
+        now = _monotonic()
+        self._snapshot_requests[command_type] = now
+        snapshot = self._snapshots.get(command_type)
+        if (snapshot is None or snapshot[1] != self._state_generation
+                or now - snapshot[0] > SNAPSHOT_MAX_AGE):
+            return None
+        return {"status": "success", "result": snapshot[2]}
+
+    def update_display(self):
+        """Called by Live on every display tick; refreshes polled snapshots."""
+        ControlSurface.update_display(self)
+        if self._snapshot_requests:
+            self._refresh_snapshots()
+
+    def _refresh_snapshots(self):
+        """Re-run the polled snapshot reads; forget those nobody polls."""
+        now = _monotonic()
+        song = self._song
+        for command_type, requested in list(self._snapshot_requests.items()):
+            if now - requested > SNAPSHOT_IDLE:
+                self._snapshot_requests.pop(command_type, None)
+                self._snapshots.pop(command_type, None)
+                continue
+            try:
+                result = _DISPATCH[command_type][0](song, {}, self)
+            except Exception:
+                self._snapshots.pop(command_type, None)
+                continue
+            self._snapshots[command_type] = (now, self._state_generation, result)
 
     # ------------------------------------------------------------------
-    # Read-only command dispatch
+    # Main-thread command queue
     # ------------------------------------------------------------------
 
-    def _dispatch_read_only(self, cmd, p):
-        """Route a read-only command to the appropriate handler function."""
-        handler = _READONLY_HANDLERS.get(cmd)
-        if handler is None:
-            raise ValueError("Unknown read-only command: {0}".format(cmd))
-        return handler(self._song, p, self)
+    def _schedule_drain(self):
+        """Make sure a drain of the pending queues is scheduled on the main thread."""
+        with self._drain_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        try:
+            self.schedule_message(0, self._drain_pending_tasks)
+        except AssertionError:
+            self.log_message("TCP command: schedule_message unavailable, returning error")
+            with self._drain_lock:
+                self._drain_scheduled = False
+            # Nothing will run the queued commands: fail them now rather
+            # than leaving their clients to time out
+            for pending in (self._pending_tasks, self._pending_slow_tasks):
+                while True:
+                    try:
+                        _, skip, _ = pending.popleft()
+                    except IndexError:
+                        break
+                    skip()
+
+    def _drain_pending_tasks(self):
+        """Run quick commands until none are left or the budget is spent,
+        then at most one slow command."""
+        with self._drain_lock:
+            self._drain_scheduled = False
+        # The document can only change between main-thread callbacks, so
+        # every task in this drain shares one song() lookup
+        song = self._song
+        pending = self._pending_tasks
+        deadline = _monotonic() + MAIN_THREAD_BUDGET
+        # Callers of superseded writes, answered with the response of the
+        # write to the same target that runs after them
+        superseded = []
+        while True:
+            try:
+                task, skip, key = pending.popleft()
+            except IndexError:
+                break
+            if key is not None:
+                try:
+                    next_key = pending[0][2]
+                except IndexError:
+                    next_key = None
+                if next_key == key:
+                    superseded.append(skip)
+                    continue
+            response = task(song)
+            for skip in superseded:
+                skip(response)
+            superseded = []
+            if _monotonic() >= deadline:
+                break
+        # Only if the follower was taken off the queue by someone else
+        for skip in superseded:
+            skip()
+        try:
+            task, _, _ = self._pending_slow_tasks.popleft()
+        except IndexError:
+            pass
+        else:
+            task(song)
+        if self._pending_tasks or self._pending_slow_tasks:
+            self._schedule_drain()
@@ -1,7 +1,79 @@
-"""Shared validation helpers used by all handler modules."""
+"""Shared validation helpers used by all handler modules.
+
+These run on every dispatched command, so they are kept flat: one frame
+per lookup, no string formatting on the success path.
+"""
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import functools
+import sys
+
+# track_type -> (song attribute holding the track list, out-of-range message,
+# the same message naming the index).  "master" is handled separately since
+# it is a single track, not a list.
+_TRACK_KIND = {
+    "track": ("tracks", "Track index out of range", "Track index {0} out of range"),
+    "return": ("return_tracks", "Return track index out of range",
+               "Return track index {0} out of range"),
+}
+
+
+class NoClipError(Exception):
+    """Raised when a clip slot that should hold a clip is empty.
+
+    The indices are kept as attributes so callers can react without
+    parsing the message; the message itself is only built when rendered.
+    """
+
+    def __init__(self, track_index=None, clip_index=None):
+        Exception.__init__(self, track_index, clip_index)
+        self.track_index = track_index
+        self.clip_index = clip_index
+
+    def __str__(self):
+        if self.track_index is None and self.clip_index is None:
+            return "No clip in slot"
+        return "No clip in slot (track={0}, clip={1})".format(
+            self.track_index, self.clip_index)
+
+
+try:
+    intern_str = sys.intern
+except AttributeError:  # Python 2 (Live 10): intern() rejects unicode
+    def intern_str(s):
+        return s
+
+
+def log_errors(message):
+    """Decorator: log "<message>: <error>" via the handler's ctrl, then re-raise.
+
+    Stands in for the try/except/log/raise block handlers used to repeat.
+    ctrl is taken from the keyword arguments or from its position in the
+    handler's signature, so it works with the dispatch tables' positional
+    calls.
+    """
+    prefix = message + ": "
+
+    def decorator(fn):
+        code = fn.__code__
+        arg_names = code.co_varnames[:code.co_argcount]
+        ctrl_pos = arg_names.index("ctrl") if "ctrl" in arg_names else None
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                ctrl = kwargs.get("ctrl")
+                if ctrl is None and ctrl_pos is not None and ctrl_pos < len(args):
+                    ctrl = args[ctrl_pos]
+                if ctrl:
+                    ctrl.log_message(prefix + str(e))
+                raise
+        return wrapper
+    return decorator
+
 
 def get_track(song, track_index, track_type="track"):
     """Get track by index with bounds validation.
@@ -17,17 +89,74 @@ def get_track(song, track_index, track_type="track"):
     Raises:
         IndexError: If track_index is out of range.
     """
-    if track_type == "return":
-        tracks = song.return_tracks
-        label = "Return track"
-    elif track_type == "master":
+    if track_type == "master":
         return song.master_track
+    attr, oor_msg, _ = _TRACK_KIND.get(track_type, _TRACK_KIND["track"])
+    # Negative indices are rejected explicitly; the upper bound is left to
+    # the subscript so the common in-range path skips the len() call.
+    if track_index < 0:
+        raise IndexError(oor_msg)
+    try:
+        return getattr(song, attr)[track_index]
+    except IndexError:
+        raise IndexError(oor_msg)
+
+
+def get_tracks(song, indices, track_type="track"):
+    """Get several tracks by index, resolving the track list only once.
+
+    Args:
+        song: Live song object.
+        indices: Iterable of zero-based indices.
+        track_type: "track" | "return".
+
+    Returns:
+        List of track objects in the order of *indices*.
+
+    Raises:
+        IndexError: On the first index that is out of range.
+    """
+    attr, _, oor_fmt = _TRACK_KIND.get(track_type, _TRACK_KIND["track"])
+    tracks = getattr(song, attr)
+    num_tracks = len(tracks)
+    result = []
+    for i in indices:
+        if i < 0 or i >= num_tracks:
+            raise IndexError(oor_fmt.format(i))
+        result.append(tracks[i])
+    return result
+
+
+def _resolve_clip(song, track_index, clip_index, track_type, require_clip,
+                  with_track=True):
+    """Resolve track, clip slot and (optionally) clip in a single frame.
+
+    Backs the get_clip* / get_clip_slot* helpers so a clip lookup doesn't
+    pay for three nested helper calls.  Returns the clip when
+    *require_clip* is true, otherwise the clip slot; paired with the
+    track as a (track, obj) tuple when *with_track* is true.
+    """
+    if track_type == "master":
+        track = song.master_track
     else:
-        tracks = song.tracks
-        label = "Track"
-    if track_index < 0 or track_index >= len(tracks):
-        raise IndexError("{0} index out of range".format(label))
-    return tracks[track_index]
+        attr, oor_msg, _ = _TRACK_KIND.get(track_type, _TRACK_KIND["track"])
+        if track_index < 0:
+            raise IndexError(oor_msg)
+        try:
+            track = getattr(song, attr)[track_index]
+        except IndexError:
+            raise IndexError(oor_msg)
+    if clip_index < 0:
+        raise IndexError("Clip index out of range")
+    try:
+        slot = track.clip_slots[clip_index]
+    except IndexError:
+        raise IndexError("Clip index out of range")
+    if not require_clip:
+        return (track, slot) if with_track else slot
+    if not slot.has_clip:
+        raise NoClipError(track_index, clip_index)
+    return (track, slot.clip) if with_track else slot.clip
 
 
 def get_clip_slot(song, track_index, clip_index, track_type="track"):
@@ -39,10 +168,7 @@ def get_clip_slot(song, track_index, clip_index, track_type="track"):
     Raises:
         IndexError: If track or clip index is out of range.
     """
-    track = get_track(song, track_index, track_type)
-    if clip_index < 0 or clip_index >= len(track.clip_slots):
-        raise IndexError("Clip index out of range")
-    return track, track.clip_slots[clip_index]
+    return _resolve_clip(song, track_index, clip_index, track_type, False)
 
 
 def get_clip(song, track_index, clip_index, track_type="track"):
@@ -53,12 +179,39 @@ def get_clip(song, track_index, clip_index, track_type="track"):
 
     Raises:
         IndexError: If track or clip index is out of range.
-        Exception: If the slot has no clip.
+        NoClipError: If the slot has no clip.
     """
-    track, slot = get_clip_slot(song, track_index, clip_index, track_type)
-    if not slot.has_clip:
-        raise Exception("No clip in slot (track={0}, clip={1})".format(track_index, clip_index))
-    return track, slot.clip
+    return _resolve_clip(song, track_index, clip_index, track_type, True)
+
+
+def get_clip_slot_only(song, track_index, clip_index, track_type="track"):
+    """Like get_clip_slot, but return just the clip slot (no track tuple)."""
+    return _resolve_clip(song, track_index, clip_index, track_type, False, False)
+
+
+def get_clip_only(song, track_index, clip_index, track_type="track"):
+    """Like get_clip, but return just the clip (no track tuple)."""
+    return _resolve_clip(song, track_index, clip_index, track_type, True, False)
+
+
+def get_clip_slots(song, track_index, clip_indices, track_type="track"):
+    """Get several clip slots on one track, resolving the slot list only once.
+
+    Returns:
+        (track, [clip_slot, ...]) tuple, slots in the order of *clip_indices*.
+
+    Raises:
+        IndexError: If the track or any clip index is out of range.
+    """
+    track = get_track(song, track_index, track_type)
+    slots = track.clip_slots
+    num_slots = len(slots)
+    result = []
+    for i in clip_indices:
+        if i < 0 or i >= num_slots:
+            raise IndexError("Clip index {0} out of range".format(i))
+        result.append(slots[i])
+    return track, result
 
 
 def get_scene(song, scene_index):
@@ -70,6 +223,21 @@ def get_scene(song, scene_index):
     Raises:
         IndexError: If scene_index is out of range.
     """
-    if scene_index < 0 or scene_index >= len(song.scenes):
+    if scene_index < 0:
+        raise IndexError("Scene index out of range")
+    try:
+        return song.scenes[scene_index]
+    except IndexError:
         raise IndexError("Scene index out of range")
-    return song.scenes[scene_index]
+
+
+def file_name(path):
+    """The last component of a Windows or POSIX *path*, or None if empty.
+
+    Responses report sample files by name only, so local paths don't
+    leak.  One rfind per separator, without normalising the whole path.
+    """
+    if not path:
+        return None
+    path = str(path)
+    return path[max(path.rfind("/"), path.rfind("\\")) + 1:]
@@ -6,6 +6,17 @@ import traceback
 
 from ._helpers import get_track, get_clip
 
+# Track.duplicate_clip_to_arrangement is a method of the class (Live 11+),
+# so whether it exists is fixed for the process: probe it once here.
+# arrangement_clips is still checked per track, since group and return
+# tracks don't have it.  Outside Live the probe can't run; the call then
+# fails on its own if the method is missing.
+try:
+    from Live.Track import Track as _Track
+except ImportError:
+    _Track = None
+_HAS_DUPLICATE_TO_ARRANGEMENT = _Track is None or hasattr(_Track, "duplicate_clip_to_arrangement")
+
 
 def _get_arrangement_clip(song, track_index, clip_index_in_arrangement, ctrl=None):
     """Get an arrangement clip by its index in the arrangement_clips list."""
@@ -19,12 +30,36 @@ def _get_arrangement_clip(song, track_index, clip_index_in_arrangement, ctrl=Non
     return track, arr_clips[clip_index_in_arrangement]
 
 
+# Fields reported for each arrangement clip, in _arrangement_clip_row order
+_CLIP_FIELDS = (
+    "name", "start_time", "end_time", "length", "loop_start", "loop_end",
+    "is_audio_clip", "is_midi_clip", "muted", "color_index",
+)
+
+
+def _arrangement_clip_row(clip):
+    """Read one arrangement clip's _CLIP_FIELDS, each property once."""
+    # getattr with a default, not hasattr + read: hasattr already reads
+    return (
+        clip.name,
+        clip.start_time,
+        clip.end_time,
+        clip.length,
+        getattr(clip, "loop_start", None),
+        getattr(clip, "loop_end", None),
+        getattr(clip, "is_audio_clip", False),
+        getattr(clip, "is_midi_clip", False),
+        getattr(clip, "muted", False),
+        getattr(clip, "color_index", None),
+    )
+
+
 def duplicate_clip_to_arrangement(song, track_index, clip_index, time, ctrl=None):
     """Copy a session clip to the arrangement timeline."""
     try:
         track, clip = get_clip(song, track_index, clip_index)
 
-        if not hasattr(track, 'duplicate_clip_to_arrangement'):
+        if not _HAS_DUPLICATE_TO_ARRANGEMENT:
             raise Exception("duplicate_clip_to_arrangement requires Live 11 or later")
 
         time = max(0.0, float(time))
@@ -42,8 +77,14 @@ def duplicate_clip_to_arrangement(song, track_index, clip_index, time, ctrl=None
         raise
 
 
-def get_arrangement_clips(song, track_index, ctrl=None):
-    """Get all clips in arrangement view for a track."""
+def get_arrangement_clips(song, track_index, compact=False, ctrl=None):
+    """Get all clips in arrangement view for a track.
+
+    With *compact*, "clips" maps each field to a list holding that field
+    for every clip, in arrangement order, instead of one object per clip:
+    a long arrangement then encodes and parses without repeating every
+    key for every clip.
+    """
     try:
         track = get_track(song, track_index)
 
@@ -53,26 +94,17 @@ def get_arrangement_clips(song, track_index, ctrl=None):
                 "(may be a group track or return track)"
             )
 
-        clips = []
-        for clip in track.arrangement_clips:
-            clip_info = {
-                "name": clip.name,
-                "start_time": clip.start_time,
-                "end_time": clip.end_time,
-                "length": clip.length,
-                "loop_start": getattr(clip, "loop_start", None),
-                "loop_end": getattr(clip, "loop_end", None),
-                "is_audio_clip": clip.is_audio_clip if hasattr(clip, 'is_audio_clip') else False,
-                "is_midi_clip": clip.is_midi_clip if hasattr(clip, 'is_midi_clip') else False,
-                "muted": getattr(clip, "muted", False),
-                "color_index": getattr(clip, "color_index", None),
-            }
-            clips.append(clip_info)
+        rows = [_arrangement_clip_row(clip) for clip in track.arrangement_clips]
+        if compact:
+            columns = list(zip(*rows)) or [()] * len(_CLIP_FIELDS)
+            clips = dict(zip(_CLIP_FIELDS, [list(column) for column in columns]))
+        else:
+            clips = [dict(zip(_CLIP_FIELDS, row)) for row in rows]
 
         return {
             "track_index": track_index,
             "track_name": track.name,
-            "clip_count": len(clips),
+            "clip_count": len(rows),
             "clips": clips,
         }
     except Exception as e:
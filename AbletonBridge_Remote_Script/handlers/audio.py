@@ -4,15 +4,37 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import traceback
 
-from ._helpers import get_track, get_clip
+from ._helpers import file_name, get_track, get_clip, get_clip_only
 
+# Clip.warp_mode values, both ways, and the kind of material each suits
+_WARP_MODE_NAMES = {
+    0: "beats", 1: "tones", 2: "texture",
+    3: "re_pitch", 4: "complex", 5: "complex_pro",
+}
+_WARP_MODES = dict((name, mode) for mode, name in _WARP_MODE_NAMES.items())
+_WARP_MODE_CHARACTERS = {
+    0: "percussive", 1: "tonal", 2: "textural",
+    3: "pitched", 4: "full_spectrum", 5: "full_spectrum",
+}
 
-def _get_audio_clip(song, track_index, clip_index):
-    """Validate indices and return the audio clip, or raise."""
-    _, clip = get_clip(song, track_index, clip_index)
+# getattr default for optional LOM properties whose value may itself be
+# None: one read answers both "is it there" and "what is it", where
+# hasattr followed by a read costs two.
+_MISSING = object()
+
+
+def _get_audio_clip(song, track_index, clip_index, with_track=False):
+    """Validate indices and return the audio clip, or raise.
+
+    With *with_track*, return (track, clip) from the same lookup.
+    """
+    if with_track:
+        track, clip = get_clip(song, track_index, clip_index)
+    else:
+        clip = get_clip_only(song, track_index, clip_index)
     if not hasattr(clip, 'is_audio_clip') or not clip.is_audio_clip:
         raise Exception("Clip is not an audio clip")
-    return clip
+    return (track, clip) if with_track else clip
 
 
 def get_audio_clip_info(song, track_index, clip_index, ctrl=None):
@@ -20,16 +42,8 @@ def get_audio_clip_info(song, track_index, clip_index, ctrl=None):
     try:
         clip = _get_audio_clip(song, track_index, clip_index)
 
-        warp_mode_map = {
-            0: "beats", 1: "tones", 2: "texture",
-            3: "re_pitch", 4: "complex", 5: "complex_pro",
-        }
-        warp_mode = "unknown"
-        if hasattr(clip, "warp_mode"):
-            warp_mode = warp_mode_map.get(clip.warp_mode, "unknown")
-
-        raw_path = getattr(clip, "file_path", None)
-        safe_name = str(raw_path).replace("\\", "/").rsplit("/", 1)[-1] if raw_path else None
+        # A missing warp_mode reads as None, which isn't in the table either
+        warp_mode = _WARP_MODE_NAMES.get(getattr(clip, "warp_mode", None), "unknown")
 
         return {
             "name": clip.name,
@@ -42,7 +56,7 @@ def get_audio_clip_info(song, track_index, clip_index, ctrl=None):
             "loop_start": getattr(clip, "loop_start", None),
             "loop_end": getattr(clip, "loop_end", None),
             "gain": getattr(clip, "gain", None),
-            "file_path": safe_name,
+            "file_path": file_name(getattr(clip, "file_path", None)),
         }
     except Exception as e:
         if ctrl:
@@ -55,17 +69,15 @@ def set_warp_mode(song, track_index, clip_index, warp_mode, ctrl=None):
     try:
         clip = _get_audio_clip(song, track_index, clip_index)
 
-        warp_mode_map = {
-            "beats": 0, "tones": 1, "texture": 2,
-            "re_pitch": 3, "complex": 4, "complex_pro": 5,
-        }
-        if warp_mode.lower() not in warp_mode_map:
+        warp_mode = warp_mode.lower()
+        mode = _WARP_MODES.get(warp_mode)
+        if mode is None:
             raise ValueError(
                 "Invalid warp mode. Must be one of: beats, tones, texture, "
                 "re_pitch, complex, complex_pro"
             )
-        clip.warp_mode = warp_mode_map[warp_mode.lower()]
-        return {"warp_mode": warp_mode.lower(), "warping": clip.warping}
+        clip.warp_mode = mode
+        return {"warp_mode": warp_mode, "warping": clip.warping}
     except Exception as e:
         if ctrl:
             ctrl.log_message("Error setting warp mode: " + str(e))
@@ -92,10 +104,10 @@ def reverse_clip(song, track_index, clip_index, ctrl=None):
     NotImplementedError.
     """
     try:
-        _get_audio_clip(song, track_index, clip_index)  # validates indices
-        track = get_track(song, track_index)
+        # Validates the indices and yields the track without a second lookup
+        track, _ = _get_audio_clip(song, track_index, clip_index, with_track=True)
 
-        # Look for a Simpler device on the track
+        # Look for a Simpler device on the track; the first one found is used
         for device in track.devices:
             class_name = getattr(device, "class_name", "")
             if class_name == "OriginalSimpler" and hasattr(device, "reverse"):
@@ -116,14 +128,9 @@ def analyze_audio_clip(song, track_index, clip_index, ctrl=None):
     """Analyze an audio clip comprehensively."""
     try:
         clip = _get_audio_clip(song, track_index, clip_index)
-
-        warp_mode_map = {
-            0: "beats", 1: "tones", 2: "texture",
-            3: "re_pitch", 4: "complex", 5: "complex_pro",
-        }
-
-        raw_path = getattr(clip, "file_path", None)
-        safe_name = str(raw_path).replace("\\", "/").rsplit("/", 1)[-1] if raw_path else None
+        # Read once each: both feed more than one section below
+        warp_mode = getattr(clip, "warp_mode", _MISSING)
+        warping = getattr(clip, "warping", None)
 
         analysis = {
             "basic_info": {
@@ -131,13 +138,13 @@ def analyze_audio_clip(song, track_index, clip_index, ctrl=None):
                 "length_beats": clip.length,
                 "loop_start": getattr(clip, "loop_start", None),
                 "loop_end": getattr(clip, "loop_end", None),
-                "file_path": safe_name,
+                "file_path": file_name(getattr(clip, "file_path", None)),
             },
             "tempo_rhythm": {
-                "warping_enabled": getattr(clip, "warping", None),
+                "warping_enabled": warping,
                 "warp_mode": (
-                    warp_mode_map.get(clip.warp_mode, "unknown")
-                    if hasattr(clip, "warp_mode") else None
+                    _WARP_MODE_NAMES.get(warp_mode, "unknown")
+                    if warp_mode is not _MISSING else None
                 ),
             },
             "audio_properties": {},
@@ -145,19 +152,24 @@ def analyze_audio_clip(song, track_index, clip_index, ctrl=None):
         }
 
         # Sample properties
-        if hasattr(clip, "sample"):
-            sample = clip.sample
+        sample = getattr(clip, "sample", None)
+        if sample is not None:
+            audio_properties = analysis["audio_properties"]
             try:
-                if hasattr(sample, "length"):
-                    analysis["audio_properties"]["sample_length"] = sample.length
-                    if hasattr(sample, "sample_rate") and sample.sample_rate > 0:
-                        analysis["audio_properties"]["duration_seconds"] = sample.length / sample.sample_rate
-                        analysis["audio_properties"]["sample_rate"] = sample.sample_rate
-                if hasattr(sample, "bit_depth"):
-                    analysis["audio_properties"]["bit_depth"] = sample.bit_depth
-                if hasattr(sample, "channels"):
-                    analysis["audio_properties"]["channels"] = sample.channels
-                    analysis["audio_properties"]["is_stereo"] = sample.channels == 2
+                length = getattr(sample, "length", _MISSING)
+                if length is not _MISSING:
+                    audio_properties["sample_length"] = length
+                    sample_rate = getattr(sample, "sample_rate", _MISSING)
+                    if sample_rate is not _MISSING and sample_rate > 0:
+                        audio_properties["duration_seconds"] = length / sample_rate
+                        audio_properties["sample_rate"] = sample_rate
+                bit_depth = getattr(sample, "bit_depth", _MISSING)
+                if bit_depth is not _MISSING:
+                    audio_properties["bit_depth"] = bit_depth
+                channels = getattr(sample, "channels", _MISSING)
+                if channels is not _MISSING:
+                    audio_properties["channels"] = channels
+                    audio_properties["is_stereo"] = channels == 2
             except Exception as sample_err:
                 if ctrl:
                     ctrl.log_message(
@@ -165,16 +177,13 @@ def analyze_audio_clip(song, track_index, clip_index, ctrl=None):
                             getattr(clip, 'name', '?'), sample_err))
 
         # Frequency hints from warp mode
-        if hasattr(clip, "warp_mode"):
-            character_map = {
-                0: "percussive", 1: "tonal", 2: "textural",
-                3: "pitched", 4: "full_spectrum", 5: "full_spectrum",
-            }
-            analysis["frequency_analysis"]["character"] = character_map.get(clip.warp_mode, "unknown")
+        if warp_mode is not _MISSING:
+            analysis["frequency_analysis"]["character"] = _WARP_MODE_CHARACTERS.get(
+                warp_mode, "unknown")
 
         # Summary
         parts = []
-        if getattr(clip, "warping", False):
+        if warping:
             parts.append("warped audio")
         else:
             parts.append("unwarped audio")
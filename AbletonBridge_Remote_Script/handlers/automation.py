@@ -2,12 +2,9 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-import re
 import traceback
 
-from ._helpers import get_track, get_clip
-
-_RE_SEND_NAME = re.compile(r'^send\s*([a-z])$')
+from ._helpers import get_track, get_clip, get_clip_only
 
 
 def _find_parameter(song, track_index, parameter_name):
@@ -22,11 +19,15 @@ def _find_parameter(song, track_index, parameter_name):
         return track.mixer_device.panning
 
     # Check send parameters — accept "send a", "send_a", "senda", etc.
-    m = _RE_SEND_NAME.match(lower.replace("_", ""))
-    if m:
-        send_index = ord(m.group(1).upper()) - ord("A")
-        if 0 <= send_index < len(track.mixer_device.sends):
-            return track.mixer_device.sends[send_index]
+    # (parsed by hand: a regex match measured slower on names this short)
+    name = lower.replace("_", "")
+    if name.startswith("send"):
+        letter = name[4:].lstrip()
+        if len(letter) == 1 and "a" <= letter <= "z":
+            send_index = ord(letter) - ord("a")
+            sends = track.mixer_device.sends
+            if send_index < len(sends):
+                return sends[send_index]
 
     # Check device parameters
     for device in track.devices:
@@ -37,6 +38,36 @@ def _find_parameter(song, track_index, parameter_name):
     raise ValueError("Parameter '{0}' not found".format(parameter_name))
 
 
+def _breakpoints(points, t_min, t_max, v_min, v_max):
+    """Clamp automation *points* into range and return them as time-ordered
+    (time, value) pairs.
+
+    Inserting in time order means each breakpoint lands after the last
+    one rather than somewhere inside the envelope.  A time given more than
+    once (also after clamping) keeps its last value instead of leaving
+    Live to pick between two inserts at the same spot.
+
+    The clamps are plain comparisons rather than nested max(min()) calls.
+    As with max(lo, min(hi, x)) the lower bound is checked last, so it
+    wins when the range is empty (t_max < t_min for a clip shorter than
+    the end margin); "not >=" also sends NaN to it.
+    """
+    by_time = {}
+    for point in points:
+        time_val = float(point.get("time", 0.0))
+        if time_val > t_max:
+            time_val = t_max
+        if not time_val >= t_min:
+            time_val = t_min
+        value = float(point.get("value", 0.0))
+        if value > v_max:
+            value = v_max
+        if not value >= v_min:
+            value = v_min
+        by_time[time_val] = value
+    return sorted(by_time.items())
+
+
 def create_clip_automation(song, track_index, clip_index, parameter_name, automation_points, ctrl=None):
     """Create automation for a parameter within a clip."""
     try:
@@ -68,19 +99,16 @@ def create_clip_automation(song, track_index, clip_index, parameter_name, automa
 
         # Insert breakpoints — Ableton linearly interpolates between them.
         # Use duration=0 to create simple breakpoints (not held steps).
-        clip_length = clip.length
-        for point in automation_points:
-            time_val = float(point.get("time", 0.0))
-            time_val = max(0.0, min(clip_length - 0.001, time_val))
-            value = float(point.get("value", 0.0))
-            clamped = max(param.min, min(param.max, value))
-            envelope.insert_step(time_val, 0.0, clamped)
+        steps = _breakpoints(automation_points, 0.0, clip.length - 0.001, param.min, param.max)
+        insert_step = envelope.insert_step
+        for time_val, value in steps:
+            insert_step(time_val, 0.0, value)
 
         return {
             "parameter": parameter_name,
             "track_index": track_index,
             "clip_index": clip_index,
-            "points_added": len(automation_points),
+            "points_added": len(steps),
         }
     except Exception as e:
         if ctrl:
@@ -89,6 +117,26 @@ def create_clip_automation(song, track_index, clip_index, parameter_name, automa
         raise
 
 
+def _sample_envelope(envelope, length, count):
+    """Read *envelope* at *count* evenly spaced times over *length* beats.
+
+    value_at_time is fetched from the envelope once, not once per sample.
+    Each time is computed as i * step rather than accumulated, so the
+    last sample doesn't carry the rounding error of all the others.
+    Times the envelope can't be read at are left out.
+    """
+    value_at_time = envelope.value_at_time
+    step = length / count
+    points = []
+    for i in range(count):
+        t = i * step
+        try:
+            points.append({"time": round(t, 4), "value": round(value_at_time(t), 4)})
+        except Exception:
+            pass
+    return points
+
+
 def get_clip_automation(song, track_index, clip_index, parameter_name, ctrl=None):
     """Read automation envelope from a clip."""
     try:
@@ -109,15 +157,7 @@ def get_clip_automation(song, track_index, clip_index, parameter_name, ctrl=None
         if clip_len <= 0:
             return {"has_automation": False, "parameter": parameter_name, "reason": "Clip has zero length"}
 
-        points = []
-        step = clip_len / num_samples
-        for i in range(num_samples):
-            t = i * step
-            try:
-                val = envelope.value_at_time(t)
-                points.append({"time": round(t, 4), "value": round(val, 4)})
-            except Exception:
-                pass
+        points = _sample_envelope(envelope, clip_len, num_samples)
 
         return {
             "has_automation": True,
@@ -167,37 +207,44 @@ def list_clip_automated_params(song, track_index, clip_index, ctrl=None):
         if not hasattr(clip, 'automation_envelope'):
             return {"automated_parameters": [], "count": 0, "reason": "Clip does not support automation envelopes"}
 
+        # Live has no list of a clip's envelopes to read, so every
+        # parameter still has to be probed.  What surrounds the probe --
+        # the bound method, the mixer device, each device's name -- is
+        # fetched once rather than per parameter.
+        get_envelope = clip.automation_envelope
+        mixer = track.mixer_device
         automated = []
 
         # Check mixer parameters
-        for name, param in [("Volume", track.mixer_device.volume), ("Pan", track.mixer_device.panning)]:
+        for name, param in (("Volume", mixer.volume), ("Pan", mixer.panning)):
             try:
-                env = clip.automation_envelope(param)
-                if env is not None:
+                if get_envelope(param) is not None:
                     automated.append({"name": name, "source": "Mixer"})
             except Exception:
                 pass
 
         # Check send parameters
-        for i, send in enumerate(track.mixer_device.sends):
+        for i, send in enumerate(mixer.sends):
             try:
-                env = clip.automation_envelope(send)
-                if env is not None:
+                if get_envelope(send) is not None:
                     automated.append({"name": "Send " + chr(65 + i), "source": "Mixer"})
             except Exception:
                 pass
 
         # Check device parameters
         for dev_idx, device in enumerate(track.devices):
+            device_name = None
             for param in device.parameters:
                 try:
-                    env = clip.automation_envelope(param)
-                    if env is not None:
-                        automated.append({
-                            "name": param.name,
-                            "source": device.name,
-                            "device_index": dev_idx,
-                        })
+                    if get_envelope(param) is None:
+                        continue
+                    if device_name is None:
+                        device_name = device.name
+                    automated.append({
+                        "name": param.name,
+                        "source": device_name,
+                        "device_index": dev_idx,
+                    })
                 except Exception:
                     pass
 
@@ -211,6 +258,31 @@ def list_clip_automated_params(song, track_index, clip_index, ctrl=None):
 # --- New: Track-level automation and arrangement time editing (from MacWhite) ---
 
 
+def _format_clip_ranges(arr_clips):
+    """The clips' ranges as "start-end, ...", for an error message."""
+    return ", ".join(
+        "{0}-{1}".format(getattr(ac, "start_time", "?"), getattr(ac, "end_time", "?"))
+        for ac in arr_clips)
+
+
+def _covering_clip(arr_clips, time):
+    """Return (clip, start, end) for the first arrangement clip covering
+    *time*, or raise ValueError listing every clip's range.
+
+    Each clip's bounds are read once; the caller reuses them.
+    """
+    for ac in arr_clips:
+        clip_start = getattr(ac, "start_time", 0.0)
+        clip_end = getattr(ac, "end_time", None)
+        if clip_end is None:
+            clip_end = clip_start + ac.length
+        if clip_start <= time < clip_end:
+            return ac, clip_start, clip_end
+    raise ValueError(
+        "No arrangement clip covers time {0}. Clip ranges: [{1}]".format(
+            time, _format_clip_ranges(arr_clips)))
+
+
 def create_track_automation(song, track_index, parameter_name, automation_points, ctrl=None):
     """Create automation for a track parameter (arrangement-level).
 
@@ -245,25 +317,9 @@ def create_track_automation(song, track_index, parameter_name, automation_points
         t_min = min(times)
 
         # Pick the first arrangement clip whose range covers t_min
-        target_clip = None
-        for ac in arr_clips:
-            clip_start = ac.start_time if hasattr(ac, "start_time") else 0.0
-            clip_end = ac.end_time if hasattr(ac, "end_time") else (clip_start + ac.length)
-            if clip_start <= t_min < clip_end:
-                target_clip = ac
-                break
-
-        if target_clip is None:
-            ranges = ["{0}-{1}".format(
-                ac.start_time if hasattr(ac, "start_time") else "?",
-                ac.end_time if hasattr(ac, "end_time") else "?") for ac in arr_clips]
-            raise ValueError(
-                "No arrangement clip covers time {0}. Clip ranges: [{1}]".format(
-                    t_min, ", ".join(ranges)))
+        target_clip, clip_start, clip_end = _covering_clip(arr_clips, t_min)
 
         # Validate all points against clip bounds
-        clip_start = target_clip.start_time if hasattr(target_clip, "start_time") else 0.0
-        clip_end = target_clip.end_time if hasattr(target_clip, "end_time") else (clip_start + target_clip.length)
         t_max = max(times)
         if t_max >= clip_end:
             raise ValueError(
@@ -282,15 +338,16 @@ def create_track_automation(song, track_index, parameter_name, automation_points
                 "Could not get automation envelope for '{0}' on arrangement clip".format(parameter_name)
             )
 
-        for point in automation_points:
-            time_val = max(clip_start, min(clip_end - 0.001, float(point.get("time", 0.0))))
-            value = max(parameter.min, min(parameter.max, float(point.get("value", 0.0))))
-            envelope.insert_step(time_val, 0.0, value)
+        steps = _breakpoints(
+            automation_points, clip_start, clip_end - 0.001, parameter.min, parameter.max)
+        insert_step = envelope.insert_step
+        for time_val, value in steps:
+            insert_step(time_val, 0.0, value)
 
         return {
             "parameter": parameter_name,
             "track_index": track_index,
-            "points_added": len(automation_points),
+            "points_added": len(steps),
         }
     except Exception as e:
         if ctrl:
@@ -331,21 +388,7 @@ def clear_track_automation(song, track_index, parameter_name, start_time, end_ti
             )
 
         # Find the arrangement clip that covers start_time
-        target_clip = None
-        clip_end = None
-        for ac in arr_clips:
-            clip_start = ac.start_time if hasattr(ac, "start_time") else 0.0
-            clip_end = ac.end_time if hasattr(ac, "end_time") else (clip_start + ac.length)
-            if clip_start <= start_time < clip_end:
-                target_clip = ac
-                break
-        if target_clip is None:
-            ranges = ["{0}-{1}".format(
-                ac.start_time if hasattr(ac, "start_time") else "?",
-                ac.end_time if hasattr(ac, "end_time") else "?") for ac in arr_clips]
-            raise ValueError(
-                "No arrangement clip covers time {0}. Clip ranges: [{1}]".format(
-                    start_time, ", ".join(ranges)))
+        target_clip, clip_start, clip_end = _covering_clip(arr_clips, start_time)
 
         # Clamp end_time to clip boundary
         if end_time > clip_end:
@@ -461,7 +504,7 @@ def clear_clip_envelope(song, track_index, clip_index, parameter_name, ctrl=None
 def clear_all_clip_envelopes(song, track_index, clip_index, ctrl=None):
     """Clear ALL automation envelopes from a clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
 
         if not hasattr(clip, 'clear_all_envelopes'):
             raise Exception("Clip does not support clear_all_envelopes()")
@@ -520,15 +563,7 @@ def get_clip_automation_hires(song, track_index, clip_index, parameter_name, sam
         if clip_len <= 0:
             return {"has_automation": False, "parameter": parameter_name, "reason": "Clip has zero length"}
 
-        points = []
-        step = clip_len / sample_count
-        for i in range(sample_count):
-            t = i * step
-            try:
-                val = envelope.value_at_time(t)
-                points.append({"time": round(t, 4), "value": round(val, 4)})
-            except Exception:
-                pass
+        points = _sample_envelope(envelope, clip_len, sample_count)
 
         return {
             "has_automation": True,
@@ -576,15 +611,29 @@ def create_step_automation(song, track_index, clip_index, parameter_name, steps,
             except Exception:
                 pass
 
+        # Bounds and insert_step read once, clamped as in _breakpoints
         clip_length = clip.length
+        t_max = clip_length - 0.001
+        v_min = param.min
+        v_max = param.max
+        insert_step = envelope.insert_step
         for step in steps:
             time_val = float(step.get("time", 0.0))
-            time_val = max(0.0, min(clip_length - 0.001, time_val))
-            value = float(step.get("value", 0.0))
+            if time_val > t_max:
+                time_val = t_max
+            if not time_val >= 0.0:
+                time_val = 0.0
             duration = float(step.get("duration", 0.0))
-            duration = max(0.0, min(clip_length - time_val, duration))
-            clamped = max(param.min, min(param.max, value))
-            envelope.insert_step(time_val, duration, clamped)
+            if duration > clip_length - time_val:
+                duration = clip_length - time_val
+            if not duration >= 0.0:
+                duration = 0.0
+            value = float(step.get("value", 0.0))
+            if value > v_max:
+                value = v_max
+            if not value >= v_min:
+                value = v_min
+            insert_step(time_val, duration, value)
 
         return {
             "parameter": parameter_name,
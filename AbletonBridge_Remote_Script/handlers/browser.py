@@ -3,6 +3,9 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import traceback
+from collections import OrderedDict
+from itertools import chain, islice
+from operator import attrgetter
 
 from ._helpers import get_track
 
@@ -12,10 +15,98 @@ _BROWSER_ROOTS = (
     "user_library", "user_folders", "samples", "packs", "current_project",
     "max_for_live", "plugins",
 )
+_BROWSER_ROOTS_SET = frozenset(_BROWSER_ROOTS)
+# Quoted root list for error messages
+_BROWSER_ROOTS_DISPLAY = ", ".join("'{0}'".format(r) for r in _BROWSER_ROOTS)
+
+# URI namespace (text before '#') -> root category that usually holds it.
+# Only used to pick which root to search first; a miss still scans them all.
+_URI_PREFIX_TO_ROOT = {
+    "query:Instruments": "instruments",
+    "query:Synths": "instruments",
+    "query:Sounds": "sounds",
+    "query:Drums": "drums",
+    "query:AudioEffects": "audio_effects",
+    "query:AudioFx": "audio_effects",
+    "query:MidiEffects": "midi_effects",
+    "query:MidiFx": "midi_effects",
+    "query:UserLibrary": "user_library",
+    "query:Samples": "samples",
+    "query:Packs": "packs",
+    "query:CurrentProject": "current_project",
+    "query:MaxForLive": "max_for_live",
+    "query:M4L": "max_for_live",
+    "query:Plugins": "plugins",
+}
+
+# The standard BrowserItem fields, fetched in a single C-level call
+_ITEM_FIELDS = attrgetter("name", "is_folder", "is_device", "is_loadable", "uri")
+
+# User-input failures: logged without a traceback (see _log_error)
+_EXPECTED_ERRORS = (ValueError, IndexError, RuntimeError)
+
+# Categories get_browser_tree reports under display names of their own.
+_TREE_CATEGORIES = (
+    ("instruments", "Instruments"),
+    ("sounds", "Sounds"),
+    ("drums", "Drums"),
+    ("audio_effects", "Audio Effects"),
+    ("midi_effects", "MIDI Effects"),
+)
+_TREE_CATEGORY_NAMES = frozenset(attr for attr, _ in _TREE_CATEGORIES)
+
+# type(browser) -> public attribute names.  The Browser's attribute surface
+# is fixed for the lifetime of the Live process, so dir() only runs once.
+_BROWSER_ATTRS_CACHE = {}
 
 _MAX_CHILDREN = 200  # cap per-folder iteration to avoid hanging on huge directories
 _MAX_SEARCH_RESULTS = 50  # stop traversal once we have enough matches
 
+# Roots load_sample falls back to searching by filename, in priority order,
+# and how many folder levels below each root that search descends.
+_NAME_SEARCH_ROOTS = ("user_library", "user_folders", "current_project", "samples")
+_NAME_SEARCH_RANK = dict((attr, rank) for rank, attr in enumerate(_NAME_SEARCH_ROOTS))
+_NAME_SEARCH_DEPTH = 5
+
+# uri -> (root_attr, BrowserItem), most recently used last.  Live hands out a
+# fresh browser proxy per access, so the key is the uri alone; each hit is
+# re-validated by uri before use.  Only hits are cached; a miss is re-searched
+# next time since items can appear.
+_URI_CACHE = OrderedDict()
+_URI_CACHE_MAX = 256
+
+
+def _log_error(ctrl, message, e):
+    """Log a handler error, adding a traceback only for unexpected errors.
+
+    Bad URIs, unknown paths and the like raise ValueError/IndexError as
+    ordinary control flow; formatting a full traceback for those is wasted
+    work and log noise.
+    """
+    if ctrl:
+        ctrl.log_message(message)
+        if not isinstance(e, _EXPECTED_ERRORS):
+            ctrl.log_message(traceback.format_exc())
+
+
+def _fast_lower(s):
+    """Lowercase *s*, returning it unchanged when it already is lowercase.
+
+    Path parts and root names are nearly always typed in lowercase, so this
+    skips allocating an identical copy on the common path.
+    """
+    return s if s.islower() else s.lower()
+
+
+def _get_browser_attrs(browser):
+    """Return the public attribute names of *browser* (cached per type)."""
+    key = type(browser)
+    attrs = _BROWSER_ATTRS_CACHE.get(key)
+    if attrs is None:
+        attrs = tuple(attr for attr in dir(browser) if not attr.startswith("_"))
+        _BROWSER_ATTRS_CACHE[key] = attrs
+    return attrs
+
 
 def _iter_children(item, max_items=_MAX_CHILDREN):
     """Yield children of a BrowserItem or elements of a list-valued root.
@@ -24,62 +115,126 @@ def _iter_children(item, max_items=_MAX_CHILDREN):
     (e.g. user_folders).  Caps iteration at *max_items*.
     """
     if isinstance(item, (list, tuple)):
-        for i, child in enumerate(item):
-            if i >= max_items:
-                break
-            yield child
-    elif hasattr(item, "children"):
-        count = 0
-        for child in item.children:
-            if count >= max_items:
-                break
-            count += 1
-            yield child
+        children = item
+    else:
+        children = getattr(item, "children", None)
+        if children is None:
+            return
+    for child in islice(children, max_items):
+        yield child
 
 
-def find_browser_item_by_uri(browser_or_item, uri, max_depth=10, current_depth=0, ctrl=None):
-    """Find a browser item by its URI (recursive search across all categories)."""
+def _seed_root_stack(browser, uri, hint_root=None):
+    """Return a DFS stack of (root, 1, root_attr) entries for every root category.
+
+    The stack is reversed so roots pop in _BROWSER_ROOTS order, except that
+    *hint_root* (or, failing that, the root guessed from the URI's namespace
+    prefix) is moved to the top.
+    """
+    if hint_root is None and uri:
+        hint_root = _URI_PREFIX_TO_ROOT.get(uri.partition("#")[0])
+    stack = []
+    for attr in _BROWSER_ROOTS:
+        root = getattr(browser, attr, None)
+        if root is None:
+            continue
+        # user_folders is a list, not a single BrowserItem
+        if attr == "user_folders":
+            try:
+                stack.extend((folder, 1, attr) for folder in root)
+            except Exception:
+                pass
+            continue
+        stack.append((root, 1, attr))
+    stack.reverse()
+    if hint_root in _BROWSER_ROOTS_SET:
+        # The top of the stack is popped first
+        stack = ([entry for entry in stack if entry[2] != hint_root]
+                 + [entry for entry in stack if entry[2] == hint_root])
+    return stack
+
+
+def _find_by_uri(browser_or_item, uri, max_depth=10, ctrl=None, hint_root=None):
+    """Depth-first URI search returning (root_attr, item), or (None, None).
+
+    *root_attr* names the Browser root category the hit was found under
+    (None when searching below a single item).  When *hint_root* names a
+    root category, that root is searched before the others; without one,
+    the root is guessed from the URI's namespace prefix.
+    """
+    # Top-level Browser object — seed the stack with every root category
+    if hasattr(browser_or_item, "instruments"):
+        stack = _seed_root_stack(browser_or_item, uri, hint_root)
+    else:
+        stack = [(browser_or_item, 0, None)]
+
+    while stack:
+        node, depth, root_attr = stack.pop()
+        try:
+            if getattr(node, "uri", None) == uri:
+                return root_attr, node
+            if depth >= max_depth:
+                continue
+            children = getattr(node, "children", None)
+            if children:
+                batch = list(islice(children, _MAX_CHILDREN))
+                batch.reverse()
+                stack.extend((child, depth + 1, root_attr) for child in batch)
+        except Exception as e:
+            if ctrl:
+                ctrl.log_message("Error finding browser item by URI: {0}".format(str(e)))
+    return None, None
+
+
+def find_browser_item_by_uri(browser_or_item, uri, max_depth=10, ctrl=None, hint_root=None):
+    """Find a browser item by its URI (depth-first search across all categories).
+
+    Walks the tree with an explicit stack instead of recursing, so the
+    Browser root check happens once and deep folders don't cost a Python
+    frame per level.  Visit order matches the old recursive search unless
+    *hint_root* moves one root category to the front.
+    """
+    return _find_by_uri(browser_or_item, uri, max_depth, ctrl, hint_root)[1]
+
+
+def _uri_cache_lookup(uri):
+    """Return (item, hint_root) from the URI cache.
+
+    *item* is None on a miss.  A cached item is re-validated by comparing its
+    uri before use; a stale entry is dropped and its root category returned
+    as *hint_root* so the fresh search starts where the item last was.
+    """
+    entry = _URI_CACHE.get(uri)
+    if entry is None:
+        return None, None
+    cached_root, item = entry
     try:
-        if hasattr(browser_or_item, "uri") and browser_or_item.uri == uri:
-            return browser_or_item
-        if current_depth >= max_depth:
-            return None
-        # Top-level Browser object — iterate all root categories
-        if hasattr(browser_or_item, "instruments"):
-            for attr in _BROWSER_ROOTS:
-                root = getattr(browser_or_item, attr, None)
-                if root is None:
-                    continue
-                # user_folders is a list, not a single BrowserItem
-                if attr == "user_folders":
-                    try:
-                        for folder in root:
-                            item = find_browser_item_by_uri(
-                                folder, uri, max_depth, current_depth + 1, ctrl)
-                            if item:
-                                return item
-                    except Exception:
-                        pass
-                    continue
-                item = find_browser_item_by_uri(
-                    root, uri, max_depth, current_depth + 1, ctrl)
-                if item:
-                    return item
-            return None
-        if hasattr(browser_or_item, "children") and browser_or_item.children:
-            count = 0
-            for child in browser_or_item.children:
-                if count >= _MAX_CHILDREN:
-                    break
-                count += 1
-                item = find_browser_item_by_uri(child, uri, max_depth, current_depth + 1, ctrl)
-                if item:
-                    return item
-        return None
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error finding browser item by URI: {0}".format(str(e)))
-        return None
+        if item.uri == uri:
+            _URI_CACHE[uri] = _URI_CACHE.pop(uri)
+            return item, cached_root
+    except Exception:
+        pass
+    _URI_CACHE.pop(uri, None)
+    return None, cached_root
+
+
+def _uri_cache_store(uri, root_attr, item):
+    _URI_CACHE[uri] = (root_attr, item)
+    if len(_URI_CACHE) > _URI_CACHE_MAX:
+        _URI_CACHE.popitem(last=False)
+
+
+def _cached_find_by_uri(browser, uri, ctrl=None, hint_root=None):
+    """find_browser_item_by_uri with a bounded LRU cache in front of it."""
+    item, cached_root = _uri_cache_lookup(uri)
+    if item is not None:
+        return item
+    if hint_root is None:
+        hint_root = cached_root
+    root_attr, item = _find_by_uri(browser, uri, ctrl=ctrl, hint_root=hint_root)
+    if item is not None:
+        _uri_cache_store(uri, root_attr, item)
+    return item
 
 
 def get_browser_item(song, uri, path, ctrl=None):
@@ -94,29 +249,23 @@ def get_browser_item(song, uri, path, ctrl=None):
         result = {"uri": uri, "path": path, "found": False}
 
         if uri:
-            item = find_browser_item_by_uri(app.browser, uri, ctrl=ctrl)
+            # A path names the root the item lives under — search it first
+            hint_root = _fast_lower(path.split("/", 1)[0]) if path else None
+            item = _cached_find_by_uri(app.browser, uri, ctrl=ctrl, hint_root=hint_root)
             if item:
                 result["found"] = True
-                result["item"] = {
-                    "name": item.name,
-                    "is_folder": item.is_folder if hasattr(item, 'is_folder') else False,
-                    "is_device": item.is_device if hasattr(item, 'is_device') else False,
-                    "is_loadable": item.is_loadable if hasattr(item, 'is_loadable') else False,
-                    "uri": item.uri,
-                }
+                result["item"] = _snapshot_item(item)
                 return result
 
         if path:
             path_parts = path.split("/")
-            root = path_parts[0].lower()
+            root = _fast_lower(path_parts[0])
             current_item = None
-            for attr in _BROWSER_ROOTS:
-                if attr == root and hasattr(app.browser, attr):
-                    current_item = getattr(app.browser, attr)
-                    break
+            if root in _BROWSER_ROOTS_SET:
+                current_item = getattr(app.browser, root, None)
             if current_item is None:
                 msg = "Unrecognized browser root '{0}'. Valid roots: {1}".format(
-                    root, ", ".join("'{0}'".format(r) for r in _BROWSER_ROOTS))
+                    root, _BROWSER_ROOTS_DISPLAY)
                 if ctrl:
                     ctrl.log_message(msg)
                 result["error"] = msg
@@ -126,9 +275,11 @@ def get_browser_item(song, uri, path, ctrl=None):
                 part = path_parts[i]
                 if not part:
                     continue
+                part_lower = _fast_lower(part)
                 found = False
                 for child in _iter_children(current_item):
-                    if hasattr(child, "name") and child.name.lower() == part.lower():
+                    child_name = getattr(child, "name", None)
+                    if child_name is not None and _fast_lower(child_name) == part_lower:
                         current_item = child
                         found = True
                         break
@@ -146,19 +297,11 @@ def get_browser_item(song, uri, path, ctrl=None):
                     "uri": None,
                 }
             else:
-                result["item"] = {
-                    "name": getattr(current_item, "name", "Unknown"),
-                    "is_folder": getattr(current_item, "is_folder", False),
-                    "is_device": getattr(current_item, "is_device", False),
-                    "is_loadable": getattr(current_item, "is_loadable", False),
-                    "uri": getattr(current_item, "uri", None),
-                }
+                result["item"] = _snapshot_item(current_item)
 
         return result
     except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error getting browser item: " + str(e))
-            ctrl.log_message(traceback.format_exc())
+        _log_error(ctrl, "Error getting browser item: " + str(e), e)
         raise
 
 
@@ -170,10 +313,10 @@ def load_browser_item(song, track_index, item_uri, ctrl=None):
             raise RuntimeError("load_browser_item requires ctrl for application()")
         app = ctrl.application()
 
-        item = find_browser_item_by_uri(app.browser, item_uri, ctrl=ctrl)
+        item = _cached_find_by_uri(app.browser, item_uri, ctrl=ctrl)
         if not item:
             raise ValueError("Browser item with URI '{0}' not found".format(item_uri))
-        if hasattr(item, 'is_loadable') and not item.is_loadable:
+        if not getattr(item, 'is_loadable', True):
             raise ValueError(
                 "Browser item '{0}' (URI: {1}) is not loadable".format(item.name, item_uri))
 
@@ -187,9 +330,7 @@ def load_browser_item(song, track_index, item_uri, ctrl=None):
             "uri": item_uri,
         }
     except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error loading browser item: {0}".format(str(e)))
-            ctrl.log_message(traceback.format_exc())
+        _log_error(ctrl, "Error loading browser item: {0}".format(e), e)
         raise
 
 
@@ -198,71 +339,60 @@ def load_instrument_or_effect(song, track_index, uri, ctrl=None):
     return load_browser_item(song, track_index, uri, ctrl)
 
 
-def _find_browser_item_by_name(browser, name, ctrl=None):
-    """Find a loadable browser item by name in user_library and related roots."""
-    name_lower = name.lower()
-    # Strip .mp3/.wav/.aif extension for flexible matching
-    name_stem = name_lower.rsplit(".", 1)[0] if "." in name_lower else name_lower
+def find_browser_item(browser, uri=None, name=None, ctrl=None, hint_root=None,
+                      max_depth=10):
+    """Find a browser item by URI, falling back to a loadable item by name.
 
-    def _search(parent, depth=0, max_depth=5):
-        if depth >= max_depth:
-            return None
+    Returns (root_attr, item, by_name), or (None, None, False).  Both lookups
+    share one walk over the Browser: every node is tested against *uri*,
+    and nodes in _NAME_SEARCH_ROOTS are also tested against *name* (with
+    any file extension stripped).  A URI hit returns at once; otherwise the
+    first name hit from the highest-priority root wins, matching the old
+    URI-then-name search without walking the tree twice on a URI miss.
+    """
+    name_lower = name.lower() if name else None
+    name_stem = name_lower
+    if name_lower:
+        head, sep, _ = name_lower.rpartition(".")
+        if sep:
+            name_stem = head
+    best_rank = len(_NAME_SEARCH_ROOTS)
+    best = best_root = None
+
+    # Entries are (node, depth, root_attr, name_ok); name_ok marks nodes the
+    # by-name search reaches, i.e. under a name root through folders only.
+    stack = [(node, depth, attr, name_lower is not None and attr in _NAME_SEARCH_RANK)
+             for node, depth, attr in _seed_root_stack(browser, uri, hint_root)]
+    while stack:
+        node, depth, root_attr, name_ok = stack.pop()
         try:
-            children = parent.children
-        except Exception:
-            return None
-        if not children:
-            return None
-        count = 0
-        for child in children:
-            if count >= _MAX_CHILDREN:
-                break
-            count += 1
-            is_folder = hasattr(child, "is_folder") and child.is_folder
-            if is_folder:
-                found = _search(child, depth + 1, max_depth)
-                if found:
-                    return found
+            if uri is not None and getattr(node, "uri", None) == uri:
+                return root_attr, node, False
+            expand_name = False
+            if name_ok:
+                if depth == 1:
+                    expand_name = True
+                elif getattr(node, "is_folder", False):
+                    expand_name = depth <= _NAME_SEARCH_DEPTH
+                elif _NAME_SEARCH_RANK[root_attr] < best_rank:
+                    node_name = getattr(node, "name", "").lower()
+                    if ((node_name == name_lower or node_name == name_stem)
+                            and getattr(node, "is_loadable", True)):
+                        best, best_root = node, root_attr
+                        best_rank = _NAME_SEARCH_RANK[root_attr]
+            if depth >= max_depth:
                 continue
-            child_name = getattr(child, "name", "").lower()
-            if child_name == name_lower or child_name == name_stem:
-                if not hasattr(child, "is_loadable") or child.is_loadable:
-                    return child
-        return None
-
-    # Search user_library first (most likely location for samples)
-    user_lib = getattr(browser, "user_library", None)
-    if user_lib:
-        found = _search(user_lib)
-        if found:
+            children = getattr(node, "children", None)
+            if children:
+                batch = list(islice(children, _MAX_CHILDREN))
+                batch.reverse()
+                stack.extend((child, depth + 1, root_attr, expand_name) for child in batch)
+        except Exception as e:
             if ctrl:
-                ctrl.log_message("Found '{0}' by name in user_library".format(name))
-            return found
-
-    # Also try user_folders
-    user_folders = getattr(browser, "user_folders", None)
-    if user_folders:
-        try:
-            for folder in user_folders:
-                found = _search(folder)
-                if found:
-                    if ctrl:
-                        ctrl.log_message("Found '{0}' by name in user_folders".format(name))
-                    return found
-        except Exception:
-            pass
-
-    # Try current_project and samples
-    for attr in ("current_project", "samples"):
-        root = getattr(browser, attr, None)
-        if root:
-            found = _search(root)
-            if found:
-                if ctrl:
-                    ctrl.log_message("Found '{0}' by name in {1}".format(name, attr))
-                return found
-
-    return None
+                ctrl.log_message("Error finding browser item: {0}".format(str(e)))
+    if best is not None:
+        return best_root, best, True
+    return None, None, False
 
 
 def load_sample(song, track_index, sample_uri, ctrl=None):
@@ -273,34 +403,34 @@ def load_sample(song, track_index, sample_uri, ctrl=None):
             raise RuntimeError("load_sample requires ctrl for application()")
         app = ctrl.application()
 
-        # Strategy 1: exact URI match
-        item = find_browser_item_by_uri(app.browser, sample_uri, ctrl=ctrl)
+        browser = app.browser
 
-        # Strategy 2: name-based search (extract filename from URI or use as-is)
-        if not item:
-            if ":" in sample_uri:
-                name = sample_uri.split(":")[-1].strip()
-            else:
-                name = sample_uri.strip()
-            if name:
+        # Exact URI match, falling back to the filename (from the URI or as-is)
+        item, hint_root = _uri_cache_lookup(sample_uri)
+        if item is None:
+            name = sample_uri.rpartition(":")[2].strip()
+            root_attr, item, by_name = find_browser_item(
+                browser, uri=sample_uri, name=name, ctrl=ctrl, hint_root=hint_root)
+            if by_name:
                 if ctrl:
                     ctrl.log_message(
-                        "URI match failed for '{0}', trying name search for '{1}'".format(
-                            sample_uri, name))
-                item = _find_browser_item_by_name(app.browser, name, ctrl=ctrl)
+                        "URI match failed for '{0}', found '{1}' by name in {2}".format(
+                            sample_uri, name, root_attr))
+            elif item is not None:
+                _uri_cache_store(sample_uri, root_attr, item)
 
         if not item:
             raise ValueError("Sample '{0}' not found in browser".format(sample_uri))
-        if hasattr(item, 'is_folder') and item.is_folder:
+        if getattr(item, 'is_folder', False):
             raise ValueError(
                 "'{0}' is a folder, not a loadable sample".format(
                     getattr(item, 'name', sample_uri)))
-        if hasattr(item, 'is_loadable') and not item.is_loadable:
+        if not getattr(item, 'is_loadable', True):
             raise ValueError(
                 "Sample item '{0}' (URI: {1}) is not loadable".format(item.name, sample_uri))
 
         song.view.selected_track = track
-        app.browser.load_item(item)
+        browser.load_item(item)
 
         return {
             "loaded": True,
@@ -309,24 +439,41 @@ def load_sample(song, track_index, sample_uri, ctrl=None):
             "uri": getattr(item, "uri", sample_uri),
         }
     except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error loading sample: {0}".format(str(e)))
-            ctrl.log_message(traceback.format_exc())
+        _log_error(ctrl, "Error loading sample: {0}".format(e), e)
         raise
 
 
+def _snapshot_item(item):
+    """Read the standard BrowserItem fields into a plain dict.
+
+    Each attribute is fetched once (every access is a Live API call);
+    children are only touched when is_folder is false.  Real BrowserItems
+    have every field, so the per-field getattr fallback is the rare path.
+    """
+    try:
+        name, is_folder, is_device, is_loadable, uri = _ITEM_FIELDS(item)
+    except AttributeError:
+        name = getattr(item, "name", "Unknown")
+        is_folder = getattr(item, "is_folder", False)
+        is_device = getattr(item, "is_device", False)
+        is_loadable = getattr(item, "is_loadable", False)
+        uri = getattr(item, "uri", None)
+    return {
+        "name": name,
+        "is_folder": is_folder or bool(getattr(item, "children", None)),
+        "is_device": is_device,
+        "is_loadable": is_loadable,
+        "uri": uri,
+    }
+
+
 def _process_item(item):
     """Build a dict for a browser item (no children recursion)."""
     if not item:
         return None
-    return {
-        "name": item.name if hasattr(item, "name") else "Unknown",
-        "is_folder": (hasattr(item, "is_folder") and item.is_folder) or (hasattr(item, "children") and bool(item.children)),
-        "is_device": hasattr(item, "is_device") and item.is_device,
-        "is_loadable": hasattr(item, "is_loadable") and item.is_loadable,
-        "uri": item.uri if hasattr(item, "uri") else None,
-        "children": [],
-    }
+    info = _snapshot_item(item)
+    info["children"] = []
+    return info
 
 
 def get_browser_tree(song, category_type, ctrl=None):
@@ -337,30 +484,27 @@ def get_browser_tree(song, category_type, ctrl=None):
         app = ctrl.application()
         if not app:
             raise RuntimeError("Could not access Live application")
-        if not hasattr(app, "browser") or app.browser is None:
+        if getattr(app, "browser", None) is None:
             raise RuntimeError("Browser is not available in the Live application")
 
-        browser_attrs = [attr for attr in dir(app.browser) if not attr.startswith("_")]
-        if ctrl:
-            ctrl.log_message("Available browser attributes: {0}".format(browser_attrs))
+        # dir() and the extra-category scan are only needed when the caller
+        # asks for everything or for a category outside _TREE_CATEGORIES
+        scan_extra = category_type == "all" or category_type not in _TREE_CATEGORY_NAMES
+        browser_attrs = None
+        if scan_extra:
+            browser_attrs = _get_browser_attrs(app.browser)
+            if ctrl:
+                ctrl.log_message("Available browser attributes: {0}".format(browser_attrs))
 
         result = {
             "type": category_type,
             "categories": [],
-            "available_categories": browser_attrs,
         }
 
-        _categories = [
-            ("instruments", "Instruments"),
-            ("sounds", "Sounds"),
-            ("drums", "Drums"),
-            ("audio_effects", "Audio Effects"),
-            ("midi_effects", "MIDI Effects"),
-        ]
-        for attr_name, display_name in _categories:
-            if (category_type == "all" or category_type == attr_name) and hasattr(app.browser, attr_name):
+        for attr_name, display_name in _TREE_CATEGORIES:
+            if category_type == "all" or category_type == attr_name:
                 try:
-                    item = _process_item(getattr(app.browser, attr_name))
+                    item = _process_item(getattr(app.browser, attr_name, None))
                     if item:
                         item["name"] = display_name
                         result["categories"].append(item)
@@ -369,19 +513,25 @@ def get_browser_tree(song, category_type, ctrl=None):
                         ctrl.log_message("Error processing {0}: {1}".format(attr_name, str(e)))
 
         # Try additional browser categories
-        known = {"instruments", "sounds", "drums", "audio_effects", "midi_effects"}
-        for attr in browser_attrs:
-            if attr not in known and (category_type == "all" or category_type == attr):
-                try:
-                    bitem = getattr(app.browser, attr)
-                    if hasattr(bitem, "children") or hasattr(bitem, "name"):
-                        category = _process_item(bitem)
-                        if category:
-                            category["name"] = attr.capitalize()
-                            result["categories"].append(category)
-                except Exception as e:
-                    if ctrl:
-                        ctrl.log_message("Error processing {0}: {1}".format(attr, str(e)))
+        if scan_extra:
+            for attr in browser_attrs:
+                if attr not in _TREE_CATEGORY_NAMES and (category_type == "all" or category_type == attr):
+                    try:
+                        bitem = getattr(app.browser, attr)
+                        if hasattr(bitem, "children") or hasattr(bitem, "name"):
+                            category = _process_item(bitem)
+                            if category:
+                                category["name"] = attr.capitalize()
+                                result["categories"].append(category)
+                    except Exception as e:
+                        if ctrl:
+                            ctrl.log_message("Error processing {0}: {1}".format(attr, str(e)))
+
+        # Callers fall back to available_categories when nothing matched
+        if browser_attrs is None and not result["categories"]:
+            browser_attrs = _get_browser_attrs(app.browser)
+        if browser_attrs is not None:
+            result["available_categories"] = browser_attrs
 
         if ctrl:
             ctrl.log_message("Browser tree generated for {0} with {1} root categories".format(
@@ -389,9 +539,7 @@ def get_browser_tree(song, category_type, ctrl=None):
             ))
         return result
     except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error getting browser tree: {0}".format(str(e)))
-            ctrl.log_message(traceback.format_exc())
+        _log_error(ctrl, "Error getting browser tree: {0}".format(e), e)
         raise
 
 
@@ -403,30 +551,22 @@ def get_browser_items_at_path(song, path, ctrl=None):
         app = ctrl.application()
         if not app:
             raise RuntimeError("Could not access Live application")
-        if not hasattr(app, "browser") or app.browser is None:
+        if getattr(app, "browser", None) is None:
             raise RuntimeError("Browser is not available in the Live application")
 
         if not path or not path.strip():
             raise ValueError("Invalid path: empty or blank")
-        browser_attrs = [attr for attr in dir(app.browser) if not attr.startswith("_")]
         path_parts = path.split("/")
 
-        root_category = path_parts[0].lower()
+        root_category = _fast_lower(path_parts[0])
         current_item = None
-
-        _category_map = {
-            "instruments": "instruments",
-            "sounds": "sounds",
-            "drums": "drums",
-            "audio_effects": "audio_effects",
-            "midi_effects": "midi_effects",
-        }
-        if root_category in _category_map and hasattr(app.browser, _category_map[root_category]):
-            current_item = getattr(app.browser, _category_map[root_category])
-        else:
+        if root_category in _BROWSER_ROOTS_SET:
+            current_item = getattr(app.browser, root_category, None)
+        if current_item is None:
+            browser_attrs = _get_browser_attrs(app.browser)
             found = False
             for attr in browser_attrs:
-                if attr.lower() == root_category:
+                if _fast_lower(attr) == root_category:
                     try:
                         current_item = getattr(app.browser, attr)
                         found = True
@@ -453,9 +593,11 @@ def get_browser_items_at_path(song, path, ctrl=None):
                     "error": "Item at '{0}' has no children".format("/".join(path_parts[:i])),
                     "items": [],
                 }
+            part_lower = _fast_lower(part)
             found = False
             for child in _iter_children(current_item):
-                if hasattr(child, "name") and child.name.lower() == part.lower():
+                child_name = getattr(child, "name", None)
+                if child_name is not None and _fast_lower(child_name) == part_lower:
                     current_item = child
                     found = True
                     break
@@ -471,21 +613,14 @@ def get_browser_items_at_path(song, path, ctrl=None):
         for child in _iter_children(current_item):
             if len(items) >= _MAX_CHILDREN:
                 break
-            item_info = {
-                "name": getattr(child, "name", "Unknown"),
-                "is_folder": getattr(child, "is_folder", False) or (hasattr(child, "children") and bool(child.children)),
-                "is_device": getattr(child, "is_device", False),
-                "is_loadable": getattr(child, "is_loadable", False),
-                "uri": getattr(child, "uri", None),
-            }
-            items.append(item_info)
+            items.append(_snapshot_item(child))
 
         is_list_root = isinstance(current_item, (list, tuple))
         result = {
             "path": path,
             "name": getattr(current_item, "name", "Unknown") if not is_list_root else path_parts[0],
             "uri": getattr(current_item, "uri", None) if not is_list_root else None,
-            "is_folder": is_list_root or getattr(current_item, "is_folder", False) or (hasattr(current_item, "children") and bool(current_item.children)),
+            "is_folder": is_list_root or bool(getattr(current_item, "is_folder", False) or getattr(current_item, "children", None)),
             "truncated": len(items) >= _MAX_CHILDREN,
             "is_device": False if is_list_root else getattr(current_item, "is_device", False),
             "is_loadable": False if is_list_root else getattr(current_item, "is_loadable", False),
@@ -496,12 +631,54 @@ def get_browser_items_at_path(song, path, ctrl=None):
             ctrl.log_message("Retrieved {0} items at path: {1}".format(len(items), path))
         return result
     except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error getting browser items at path: {0}".format(str(e)))
-            ctrl.log_message(traceback.format_exc())
+        _log_error(ctrl, "Error getting browser items at path: {0}".format(e), e)
         raise
 
 
+def _iter_search_roots(browser, attrs):
+    """Yield the BrowserItems to search for each root category in *attrs*."""
+    for attr in attrs:
+        # user_folders is a list, not a single BrowserItem
+        if attr == "user_folders":
+            try:
+                folders = list(getattr(browser, attr, None) or ())
+            except Exception:
+                continue
+            for folder in folders:
+                yield folder
+            continue
+        root = getattr(browser, attr, None)
+        if root is not None:
+            yield root
+
+
+def _iter_search_matches(root, query_lower, max_depth=5):
+    """Yield a snapshot of each item under *root* whose name contains *query_lower*.
+
+    Items come out in the same pre-order a recursive walk would produce; the
+    walk is driven by the consumer, so it stops as soon as it stops being
+    iterated.
+    """
+    stack = [(root, 0)]
+    while stack:
+        item, depth = stack.pop()
+        if not item:
+            continue
+        item_name = getattr(item, "name", None)
+        if item_name is not None and query_lower in item_name.lower():
+            yield _snapshot_item(item)
+        if depth + 1 >= max_depth:
+            continue
+        try:
+            children = item.children
+        except Exception:
+            continue
+        if children:
+            batch = list(islice(children, _MAX_CHILDREN))
+            batch.reverse()
+            stack.extend((child, depth + 1) for child in batch)
+
+
 def search_browser(song, query, category, ctrl=None):
     """Search the browser for items matching a query."""
     try:
@@ -510,87 +687,36 @@ def search_browser(song, query, category, ctrl=None):
         app = ctrl.application()
         if not app:
             raise RuntimeError("Could not access Live application")
-        if not hasattr(app, "browser") or app.browser is None:
+        if getattr(app, "browser", None) is None:
             raise RuntimeError("Browser is not available in the Live application")
 
-        results = []
+        browser = app.browser
         query_lower = query.lower()
-
-        def search_item(item, depth=0, max_depth=5):
-            if len(results) >= _MAX_SEARCH_RESULTS:
-                return
-            if depth >= max_depth:
-                return
-            if not item:
-                return
-            if hasattr(item, "name") and query_lower in item.name.lower():
-                result_item = {
-                    "name": item.name,
-                    "is_folder": (hasattr(item, "is_folder") and item.is_folder) or (hasattr(item, "children") and bool(item.children)),
-                    "is_device": hasattr(item, "is_device") and item.is_device,
-                    "is_loadable": hasattr(item, "is_loadable") and item.is_loadable,
-                    "uri": item.uri if hasattr(item, "uri") else None,
-                }
-                results.append(result_item)
-            if hasattr(item, "children"):
-                try:
-                    children = item.children
-                except Exception:
-                    return
-                if children:
-                    count = 0
-                    for child in children:
-                        if count >= _MAX_CHILDREN:
-                            break
-                        count += 1
-                        search_item(child, depth + 1, max_depth)
-
         if category == "all":
-            for attr in _BROWSER_ROOTS:
-                if len(results) >= _MAX_SEARCH_RESULTS:
-                    break
-                if attr == "user_folders":
-                    try:
-                        for folder in getattr(app.browser, "user_folders", []):
-                            if len(results) >= _MAX_SEARCH_RESULTS:
-                                break
-                            search_item(folder)
-                    except Exception:
-                        pass
-                    continue
-                root = getattr(app.browser, attr, None)
-                if root is not None:
-                    search_item(root)
-        elif category in _BROWSER_ROOTS:
-            if category == "user_folders":
-                try:
-                    for folder in getattr(app.browser, "user_folders", []):
-                        if len(results) >= _MAX_SEARCH_RESULTS:
-                            break
-                        search_item(folder)
-                except Exception:
-                    pass
-            else:
-                root = getattr(app.browser, category, None)
-                if root is not None:
-                    search_item(root)
+            attrs = _BROWSER_ROOTS
+        elif category in _BROWSER_ROOTS_SET:
+            attrs = (category,)
         else:
             msg = "Invalid browser category '{0}'. Valid: 'all', {1}".format(
-                category, ", ".join("'{0}'".format(r) for r in _BROWSER_ROOTS))
+                category, _BROWSER_ROOTS_DISPLAY)
             if ctrl:
                 ctrl.log_message(msg)
             raise ValueError(msg)
 
+        # Lazy: once enough hits are drawn no further node or root is visited
+        hits = chain.from_iterable(
+            _iter_search_matches(root, query_lower)
+            for root in _iter_search_roots(browser, attrs))
+        results = list(islice(hits, _MAX_SEARCH_RESULTS))
+
         return {
             "query": query,
             "category": category,
-            "results": results[:50],
+            "results": results,
             "total_found": len(results),
         }
     except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error searching browser: {0}".format(str(e)))
-            ctrl.log_message(traceback.format_exc())
+        _log_error(ctrl, "Error searching browser: {0}".format(e), e)
         raise
 
 
@@ -604,17 +730,9 @@ def get_user_library(song, ctrl=None):
             raise RuntimeError("Could not access Live application")
 
         items = []
-        if hasattr(app.browser, "user_library"):
-            user_lib = app.browser.user_library
-            if hasattr(user_lib, "children"):
-                for child in user_lib.children:
-                    if len(items) >= _MAX_CHILDREN:
-                        break
-                    items.append({
-                        "name": child.name if hasattr(child, "name") else "Unknown",
-                        "is_folder": (hasattr(child, "is_folder") and child.is_folder) or (hasattr(child, "children") and bool(child.children)),
-                        "uri": child.uri if hasattr(child, "uri") else None,
-                    })
+        children = getattr(getattr(app.browser, "user_library", None), "children", None)
+        if children:
+            items = [_snapshot_item(child) for child in islice(children, _MAX_CHILDREN)]
         return {"items": items, "count": len(items)}
     except Exception as e:
         if ctrl:
@@ -632,22 +750,16 @@ def get_user_folders(song, ctrl=None):
             raise RuntimeError("Could not access Live application")
 
         items = []
-        if hasattr(app.browser, "user_folders"):
-            for folder in app.browser.user_folders:
-                folder_items = []
-                if hasattr(folder, "children"):
-                    for child in folder.children:
-                        if len(folder_items) >= _MAX_CHILDREN:
-                            break
-                        folder_items.append({
-                            "name": child.name if hasattr(child, "name") else "Unknown",
-                            "uri": child.uri if hasattr(child, "uri") else None,
-                        })
-                items.append({
-                    "name": folder.name if hasattr(folder, "name") else "Unknown",
-                    "uri": folder.uri if hasattr(folder, "uri") else None,
-                    "items": folder_items,
-                })
+        for folder in getattr(app.browser, "user_folders", None) or ():
+            children = getattr(folder, "children", None) or ()
+            items.append({
+                "name": getattr(folder, "name", "Unknown"),
+                "uri": getattr(folder, "uri", None),
+                "items": [{
+                    "name": getattr(child, "name", "Unknown"),
+                    "uri": getattr(child, "uri", None),
+                } for child in islice(children, _MAX_CHILDREN)],
+            })
         return {"folders": items, "count": len(items)}
     except Exception as e:
         if ctrl:
@@ -664,8 +776,8 @@ def get_device_presets(song, track_index, device_index, track_type="track", ctrl
         raise IndexError("Device index {0} out of range".format(device_index))
 
     device = track.devices[device_index]
-    class_name = device.class_name if hasattr(device, 'class_name') else ""
-    device_name = device.name if hasattr(device, 'name') else ""
+    class_name = getattr(device, 'class_name', "")
+    device_name = getattr(device, 'name', "")
 
     # Note: VST/AU internal presets are NOT accessible through the Live API
     # We can only browse Ableton's preset library for native devices
@@ -687,31 +799,29 @@ def get_device_presets(song, track_index, device_index, track_type="track", ctrl
     # Navigate through instruments or audio_effects categories
     try:
         # Search through browser items matching the device class name
-        categories_to_search = []
-        if hasattr(browser, 'instruments'):
-            categories_to_search.append(browser.instruments)
-        if hasattr(browser, 'audio_effects'):
-            categories_to_search.append(browser.audio_effects)
-        if hasattr(browser, 'midi_effects'):
-            categories_to_search.append(browser.midi_effects)
+        categories_to_search = [
+            category for category in (
+                getattr(browser, 'instruments', None),
+                getattr(browser, 'audio_effects', None),
+                getattr(browser, 'midi_effects', None),
+            ) if category is not None
+        ]
 
+        class_lower = class_name.lower()
+        device_lower = device_name.lower()
         for category in categories_to_search:
-            if not hasattr(category, 'children'):
-                continue
-            for child in category.children:
-                child_name = child.name if hasattr(child, 'name') else ""
-                if child_name.lower() == class_name.lower() or child_name.lower() == device_name.lower():
+            for child in getattr(category, 'children', None) or ():
+                child_lower = getattr(child, 'name', "").lower()
+                if child_lower == class_lower or child_lower == device_lower:
                     # Found the device category - list its presets
-                    if hasattr(child, 'children'):
-                        for preset in child.children:
-                            preset_name = preset.name if hasattr(preset, 'name') else ""
-                            preset_uri = preset.uri if hasattr(preset, 'uri') else ""
-                            if preset_name:
-                                presets.append({
-                                    "name": preset_name,
-                                    "uri": preset_uri,
-                                    "is_folder": bool(preset.is_folder) if hasattr(preset, 'is_folder') else False,
-                                })
+                    for preset in getattr(child, 'children', None) or ():
+                        preset_name = getattr(preset, 'name', "")
+                        if preset_name:
+                            presets.append({
+                                "name": preset_name,
+                                "uri": getattr(preset, 'uri', ""),
+                                "is_folder": bool(getattr(preset, 'is_folder', False)),
+                            })
                     break
     except Exception as e:
         return {"device_name": device_name, "presets": [], "error": str(e)}
@@ -753,21 +863,21 @@ def load_device_preset(song, track_index, device_index, preset_uri, track_type="
     # Use the browser to load the preset via hot-swap
     try:
         # Find the browser item by URI
-        item = find_browser_item_by_uri(browser, preset_uri, ctrl=ctrl)
+        item = _cached_find_by_uri(browser, preset_uri, ctrl=ctrl)
         if item is None:
             raise ValueError("Could not find preset with URI: {0}".format(preset_uri))
 
         # Hot-swap the preset onto the device
-        if hasattr(browser, 'load_item'):
-            browser.load_item(item)
-        else:
+        load_item = getattr(browser, 'load_item', None)
+        if load_item is None:
             raise ValueError("Browser load_item not available")
+        load_item(item)
 
     except AttributeError:
         raise ValueError("Preset loading not supported in this Ableton version")
 
     return {
-        "device_name": device.name if hasattr(device, 'name') else "",
+        "device_name": getattr(device, 'name', ""),
         "preset_uri": preset_uri,
         "loaded": True,
     }
@@ -793,7 +903,7 @@ def preview_browser_item(song, uri=None, action="preview", ctrl=None):
         elif action == "preview":
             if not uri:
                 raise ValueError("uri is required for preview action")
-            item = find_browser_item_by_uri(browser, uri, ctrl=ctrl)
+            item = _cached_find_by_uri(browser, uri, ctrl=ctrl)
             if item is None:
                 raise ValueError("Browser item not found for URI: {0}".format(uri))
             browser.preview_item(item)
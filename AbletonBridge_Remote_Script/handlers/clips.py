@@ -4,7 +4,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import collections.abc
 
-from ._helpers import get_track, get_clip_slot, get_clip
+from ._helpers import NoClipError, get_track, get_clip_slot, get_clip_only, get_clip_slot_only
 
 
 def create_clip(song, track_index, clip_index, length, ctrl=None):
@@ -30,7 +30,7 @@ def create_clip(song, track_index, clip_index, length, ctrl=None):
 def add_notes_to_clip(song, track_index, clip_index, notes, ctrl=None):
     """Add MIDI notes to a clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
 
         # Validate and normalize note data
         note_specs = []
@@ -90,7 +90,7 @@ def add_notes_to_clip(song, track_index, clip_index, notes, ctrl=None):
 def set_clip_name(song, track_index, clip_index, name, ctrl=None):
     """Set the name of a clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         clip.name = name
         return {"name": clip.name}
     except Exception as e:
@@ -102,9 +102,9 @@ def set_clip_name(song, track_index, clip_index, name, ctrl=None):
 def fire_clip(song, track_index, clip_index, ctrl=None):
     """Fire a clip."""
     try:
-        _, clip_slot = get_clip_slot(song, track_index, clip_index)
+        clip_slot = get_clip_slot_only(song, track_index, clip_index)
         if not clip_slot.has_clip:
-            raise Exception("No clip in slot")
+            raise NoClipError(track_index, clip_index)
         clip_slot.fire()
         return {"fired": True}
     except Exception as e:
@@ -116,7 +116,7 @@ def fire_clip(song, track_index, clip_index, ctrl=None):
 def stop_clip(song, track_index, clip_index, ctrl=None):
     """Stop a clip."""
     try:
-        _, clip_slot = get_clip_slot(song, track_index, clip_index)
+        clip_slot = get_clip_slot_only(song, track_index, clip_index)
         clip_slot.stop()
         return {"stopped": True}
     except Exception as e:
@@ -128,9 +128,9 @@ def stop_clip(song, track_index, clip_index, ctrl=None):
 def delete_clip(song, track_index, clip_index, ctrl=None):
     """Delete a clip from a clip slot."""
     try:
-        _, clip_slot = get_clip_slot(song, track_index, clip_index)
+        clip_slot = get_clip_slot_only(song, track_index, clip_index)
         if not clip_slot.has_clip:
-            raise Exception("No clip in slot")
+            raise NoClipError(track_index, clip_index)
         clip_name = clip_slot.clip.name
         clip_slot.delete_clip()
         return {
@@ -148,7 +148,7 @@ def delete_clip(song, track_index, clip_index, ctrl=None):
 def get_clip_info(song, track_index, clip_index, ctrl=None):
     """Get detailed information about a clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
 
         result = {
             "name": clip.name,
@@ -210,12 +210,14 @@ def duplicate_clip(song, track_index, clip_index, target_clip_index, ctrl=None):
     """Duplicate a clip to another slot on the same track."""
     try:
         track = get_track(song, track_index)
-        if clip_index < 0 or clip_index >= len(track.clip_slots):
+        slots = track.clip_slots
+        num_slots = len(slots)
+        if clip_index < 0 or clip_index >= num_slots:
             raise IndexError("Source clip index out of range")
-        if target_clip_index < 0 or target_clip_index >= len(track.clip_slots):
+        if target_clip_index < 0 or target_clip_index >= num_slots:
             raise IndexError("Target clip index out of range")
-        source_slot = track.clip_slots[clip_index]
-        target_slot = track.clip_slots[target_clip_index]
+        source_slot = slots[clip_index]
+        target_slot = slots[target_clip_index]
         if not source_slot.has_clip:
             raise Exception("No clip in source slot")
         if target_slot.has_clip:
@@ -236,7 +238,7 @@ def duplicate_clip(song, track_index, clip_index, target_clip_index, ctrl=None):
 def set_clip_looping(song, track_index, clip_index, looping, ctrl=None):
     """Set the looping state of a clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         clip.looping = bool(int(looping))
         return {
             "track_index": track_index,
@@ -252,7 +254,7 @@ def set_clip_looping(song, track_index, clip_index, looping, ctrl=None):
 def set_clip_loop_points(song, track_index, clip_index, loop_start, loop_end, ctrl=None):
     """Set the loop start and end points of a clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
 
         loop_start = float(loop_start)
         loop_end = float(loop_end)
@@ -283,7 +285,7 @@ def set_clip_loop_points(song, track_index, clip_index, loop_start, loop_end, ct
 def set_clip_color(song, track_index, clip_index, color_index, ctrl=None):
     """Set the color of a clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         color_index = int(color_index)
         if color_index < 0 or color_index > 69:
             raise ValueError("color_index must be between 0 and 69, got {0}".format(color_index))
@@ -302,7 +304,7 @@ def set_clip_color(song, track_index, clip_index, color_index, ctrl=None):
 def crop_clip(song, track_index, clip_index, ctrl=None):
     """Trim clip to its loop region."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not hasattr(clip, 'crop'):
             raise Exception("clip.crop() not available in this Live version")
         clip.crop()
@@ -320,7 +322,7 @@ def crop_clip(song, track_index, clip_index, ctrl=None):
 def duplicate_clip_loop(song, track_index, clip_index, ctrl=None):
     """Double the loop content of a clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not hasattr(clip, 'duplicate_loop'):
             raise Exception("clip.duplicate_loop() not available in this Live version")
         old_length = clip.length
@@ -339,7 +341,7 @@ def duplicate_clip_loop(song, track_index, clip_index, ctrl=None):
 def set_clip_start_end(song, track_index, clip_index, start_marker, end_marker, ctrl=None):
     """Set clip start_marker and end_marker."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
 
         if start_marker is not None and end_marker is not None:
             sm = float(start_marker)
@@ -388,7 +390,7 @@ def set_clip_pitch(song, track_index, clip_index, pitch_coarse=None, pitch_fine=
         pitch_fine: Cents (-50 to +50)
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not clip.is_audio_clip:
             raise ValueError("Clip is not an audio clip")
         if pitch_coarse is not None:
@@ -421,7 +423,7 @@ def set_clip_launch_mode(song, track_index, clip_index, launch_mode, ctrl=None):
         launch_mode: 0=trigger, 1=gate, 2=toggle, 3=repeat
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         launch_mode = int(launch_mode)
         if launch_mode < 0 or launch_mode > 3:
             raise ValueError(
@@ -447,7 +449,7 @@ def set_clip_launch_quantization(song, track_index, clip_index, quantization, ct
             13=thirtysecond, 14=global
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         quantization = int(quantization)
         if quantization < 0 or quantization > 14:
             raise ValueError("Launch quantization must be 0-14")
@@ -470,7 +472,7 @@ def set_clip_legato(song, track_index, clip_index, legato, ctrl=None):
                 False = clip always starts from its start position.
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         clip.legato = bool(int(legato))
         return {
             "legato": clip.legato,
@@ -489,7 +491,7 @@ def audio_to_midi(song, track_index, clip_index, conversion_type, ctrl=None):
         conversion_type: 'drums', 'harmony', or 'melody'
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not clip.is_audio_clip:
             raise ValueError("Clip is not an audio clip")
         conversion_type = str(conversion_type).lower()
@@ -536,7 +538,7 @@ def duplicate_clip_region(song, track_index, clip_index,
         transposition_amount: Semitones to transpose (0 for none).
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if clip.is_audio_clip:
             raise ValueError("duplicate_region is only available for MIDI clips")
         clip.duplicate_region(float(region_start), float(region_length),
@@ -563,7 +565,7 @@ def move_clip_playing_pos(song, track_index, clip_index, time, ctrl=None):
         time: The time position to jump to within the clip.
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         clip.move_playing_pos(float(time))
         return {
             "track_index": track_index,
@@ -585,7 +587,7 @@ def set_clip_grid(song, track_index, clip_index,
         grid_is_triplet: True to show grid in triplet mode, False for standard.
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         changes = {}
         if grid_quantization is not None:
             clip.view.grid_quantization = int(grid_quantization)
@@ -611,7 +613,7 @@ def set_clip_grid(song, track_index, clip_index,
 def get_clip_follow_actions(song, track_index, clip_index, ctrl=None):
     """Get follow action settings for a clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         result = {
             "track_index": track_index,
             "clip_index": clip_index,
@@ -659,7 +661,7 @@ def set_clip_follow_actions(song, track_index, clip_index,
         follow_action_return_to_zero: Return to clip start after follow action
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         changes = {}
         if follow_action_0 is not None:
             clip.follow_action_0 = int(follow_action_0)
@@ -701,7 +703,7 @@ def set_clip_follow_actions(song, track_index, clip_index,
 def get_clip_properties(song, track_index, clip_index, ctrl=None):
     """Get extended clip properties including follow actions, RAM mode, etc."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         result = {
             "track_index": track_index,
             "clip_index": clip_index,
@@ -744,7 +746,7 @@ def set_clip_properties(song, track_index, clip_index,
                          ram_mode=None, warping=None, gain=None, ctrl=None):
     """Set multiple clip properties at once."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         changes = {}
         if muted is not None:
             clip.muted = bool(muted)
@@ -785,7 +787,7 @@ def set_clip_properties(song, track_index, clip_index,
 def select_all_notes(song, track_index, clip_index, ctrl=None):
     """Select all notes in a MIDI clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if clip.is_audio_clip:
             raise ValueError("select_all_notes is only for MIDI clips")
         clip.select_all_notes()
@@ -799,7 +801,7 @@ def select_all_notes(song, track_index, clip_index, ctrl=None):
 def set_clip_start_time(song, track_index, clip_index, time, ctrl=None):
     """Set the start_time of a clip (arrangement position, Live 12.2+)."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         clip.start_time = float(time)
         return {
             "track_index": track_index,
@@ -874,7 +876,7 @@ def create_arrangement_audio_clip(song, track_index, time, length, ctrl=None):
 def get_warp_markers(song, track_index, clip_index, ctrl=None):
     """Get the warp markers of an audio clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not clip.is_audio_clip:
             raise ValueError("Warp markers are only available on audio clips")
         markers = []
@@ -931,7 +933,7 @@ def add_warp_marker(song, track_index, clip_index, beat_time, sample_time=None,
         sample_time: The sample position (if None, auto-calculated by Live).
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not clip.is_audio_clip:
             raise ValueError("Warp markers are only available on audio clips")
         bt = float(beat_time)
@@ -958,7 +960,7 @@ def move_warp_marker(song, track_index, clip_index, beat_time, beat_time_distanc
         beat_time_distance: Amount (in beats) to shift the marker.
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not clip.is_audio_clip:
             raise ValueError("Warp markers are only available on audio clips")
         clip.move_warp_marker(float(beat_time), float(beat_time_distance))
@@ -980,7 +982,7 @@ def remove_warp_marker(song, track_index, clip_index, beat_time, ctrl=None):
         beat_time: Beat position of the warp marker to remove.
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not clip.is_audio_clip:
             raise ValueError("Warp markers are only available on audio clips")
         clip.remove_warp_marker(float(beat_time))
@@ -1000,7 +1002,7 @@ def remove_warp_marker(song, track_index, clip_index, beat_time, ctrl=None):
 def deselect_all_notes(song, track_index, clip_index, ctrl=None):
     """Deselect all notes in a MIDI clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if clip.is_audio_clip:
             raise ValueError("deselect_all_notes is only for MIDI clips")
         clip.deselect_all_notes()
@@ -1014,7 +1016,7 @@ def deselect_all_notes(song, track_index, clip_index, ctrl=None):
 def get_selected_notes(song, track_index, clip_index, ctrl=None):
     """Get the currently selected notes in a MIDI clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if clip.is_audio_clip:
             raise ValueError("get_selected_notes is only for MIDI clips")
 
@@ -1063,7 +1065,7 @@ def get_selected_notes(song, track_index, clip_index, ctrl=None):
 def set_fire_button_state(song, track_index, clip_index, state, ctrl=None):
     """Set the clip's fire button state directly (supports all launch modes)."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         clip.set_fire_button_state(bool(state))
         return {"track_index": track_index, "clip_index": clip_index, "fire_button_state": bool(state)}
     except Exception as e:
@@ -1075,7 +1077,7 @@ def set_fire_button_state(song, track_index, clip_index, state, ctrl=None):
 def clip_scrub_native(song, track_index, clip_index, position, ctrl=None):
     """Start scrubbing inside a clip (via Remote Script, not M4L)."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         clip.scrub(float(position))
         return {"scrubbing": True, "position": float(position)}
     except Exception as e:
@@ -1087,7 +1089,7 @@ def clip_scrub_native(song, track_index, clip_index, position, ctrl=None):
 def clip_stop_scrub(song, track_index, clip_index, ctrl=None):
     """Stop scrubbing a clip."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         clip.stop_scrub()
         return {"stopped_scrub": True}
     except Exception as e:
@@ -1099,7 +1101,7 @@ def clip_stop_scrub(song, track_index, clip_index, ctrl=None):
 def clip_beat_to_sample_time(song, track_index, clip_index, beat_time, ctrl=None):
     """Convert beat time to sample time (audio clips only)."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not clip.is_audio_clip:
             raise ValueError("beat_to_sample_time is only for audio clips")
         sample_time = clip.beat_to_sample_time(float(beat_time))
@@ -1113,7 +1115,7 @@ def clip_beat_to_sample_time(song, track_index, clip_index, beat_time, ctrl=None
 def clip_sample_to_beat_time(song, track_index, clip_index, sample_time, ctrl=None):
     """Convert sample time to beat time (audio clips only)."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not clip.is_audio_clip:
             raise ValueError("sample_to_beat_time is only for audio clips")
         beat_time = clip.sample_to_beat_time(float(sample_time))
@@ -2,7 +2,7 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from ._helpers import get_track
+from ._helpers import file_name, get_track
 
 
 def resolve_track(song, track_index, track_type="track"):
@@ -331,6 +331,44 @@ def set_device_parameters_batch(
         raise
 
 
+def apply_parameter_values(song, track_index, device_index, entries, track_type="track", ctrl=None):
+    """Write {'name', 'value' | 'value_display'} *entries* to one device.
+
+    Used for coalesced UDP updates.  The device is resolved once; each
+    name goes to the first parameter with that name, as in
+    set_device_parameter; an entry that fails, or has neither value nor
+    value_display, is logged and skipped without stopping the rest.
+    Returns the number of entries written.
+    """
+    track, device = _resolve_device(song, track_index, device_index, track_type)
+    by_name = {}
+    for param in device.parameters:
+        by_name.setdefault(param.name, param)
+
+    written = 0
+    for entry in entries:
+        name = entry.get("name", "")
+        try:
+            target = by_name.get(name)
+            if target is None:
+                raise ValueError("not found")
+            value_display = entry.get("value_display")
+            if value_display is not None:
+                value = _resolve_display_value(target, value_display, ctrl)
+            elif "value" in entry:
+                value = float(entry["value"])
+                if getattr(target, "is_quantized", False):
+                    value = int(round(value))
+            else:
+                raise ValueError("missing value or value_display")
+            target.value = max(target.min, min(target.max, value))
+            written += 1
+        except Exception as e:
+            if ctrl:
+                ctrl.log_message("UDP parameter update error: '{0}' {1}".format(name, e))
+    return written
+
+
 def _resolve_device(song, track_index, device_index, track_type="track"):
     """Resolve a track and device by index, supporting track/return/master."""
     track = resolve_track(song, track_index, track_type)
@@ -1100,9 +1138,8 @@ def get_simpler_properties(song, track_index, device_index, track_type="track",
             except Exception:
                 sample_data[prop] = None
         try:
-            raw_path = str(sample.file_path)
             # Only expose filename, not full path (avoids leaking local paths)
-            sample_data["file_path"] = raw_path.replace("\\", "/").rsplit("/", 1)[-1] if raw_path else None
+            sample_data["file_path"] = file_name(sample.file_path)
         except Exception:
             sample_data["file_path"] = None
         try:
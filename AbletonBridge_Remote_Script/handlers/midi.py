@@ -4,7 +4,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import traceback
 
-from ._helpers import get_clip
+from ._helpers import get_clip_only
 
 
 def get_clip_notes(song, track_index, clip_index, start_time, time_span, start_pitch, pitch_span, ctrl=None):
@@ -447,7 +447,7 @@ def apply_groove(song, track_index, clip_index, groove_amount, ctrl=None):
 
 def _get_midi_clip(song, track_index, clip_index):
     """Get a MIDI clip with validation."""
-    _, clip = get_clip(song, track_index, clip_index)
+    clip = get_clip_only(song, track_index, clip_index)
     if not hasattr(clip, 'get_notes'):
         raise Exception("Clip is not a MIDI clip")
     return clip
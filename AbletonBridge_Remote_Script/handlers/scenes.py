@@ -1,107 +1,167 @@
-"""Scene create/delete/duplicate, trigger, rename."""
+"""Scene create/delete/duplicate, trigger, rename.
+
+There is no computation here: each handler is a few reads and writes on
+Live scene objects, and every one of those crosses into Live's C++ side.
+Cost is the number of crossings, so changes to this module should aim at
+touching the Live API less (reuse handles, batch reads, echo values that
+were just written) rather than at the Python around it.
+"""
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from ._helpers import get_scene
+from operator import attrgetter
+
+from ._helpers import get_scene, intern_str, log_errors
+
+# Scene follow-action properties, in response order.  Live 10/11 scenes
+# lack some or all of them; a missing one is reported as None.  The names
+# are interned since they double as response keys and setattr names.
+_FA_PROPS = tuple(intern_str(prop) for prop in (
+    "follow_action_0", "follow_action_1",
+    "follow_action_probability", "follow_action_time",
+    "follow_action_enabled", "follow_action_linked",
+))
+_FA_GETTER = attrgetter(*_FA_PROPS)
+
+# Accepted ranges for scene color and tempo (a tempo of 0 clears the override)
+_COLOR_MIN, _COLOR_MAX = 0, 69
+_TEMPO_MIN, _TEMPO_MAX = 20.0, 999.0
+_COLOR_ERR = "color_index must be 0-69, got {0}"
+_TEMPO_ERR = "Tempo must be 0 (to clear override) or between 20 and 999 BPM, got {0}"
+
+# (property, coercion, (lo, hi) clamp or None), in _FA_PROPS order so it
+# lines up with set_scene_follow_actions' keyword arguments.
+_FA_SETTERS = tuple((prop,) + spec for prop, spec in zip(_FA_PROPS, (
+    (int, None),
+    (int, None),
+    (float, (0.0, 1.0)),
+    (float, None),
+    (bool, None),
+    (bool, None),
+)))
+
+
+def _coerce_color(color_index):
+    color_index = int(color_index)
+    if not _COLOR_MIN <= color_index <= _COLOR_MAX:
+        raise ValueError(_COLOR_ERR.format(color_index))
+    return color_index
+
+
+def _coerce_tempo(tempo):
+    tempo = float(tempo)
+    if tempo != 0 and not _TEMPO_MIN <= tempo <= _TEMPO_MAX:
+        raise ValueError(_TEMPO_ERR.format(tempo))
+    return tempo
 
 
+def _follow_action_writes(values):
+    """Coerce and clamp *values* (in _FA_PROPS order; None = leave alone).
+
+    Returns a list of (property, value) pairs ready for setattr.
+    """
+    writes = []
+    for (prop, coerce, clamp), raw in zip(_FA_SETTERS, values):
+        if raw is None:
+            continue
+        val = coerce(raw)
+        if clamp is not None:
+            val = max(clamp[0], min(clamp[1], val))
+        writes.append((prop, val))
+    return writes
+
+
+@log_errors("Error creating scene")
 def create_scene(song, index, name="", ctrl=None):
     """Create a new scene."""
-    try:
-        if index < 0:
-            index = len(song.scenes)
-        song.create_scene(index)
-        scene = song.scenes[index]
-        if name:
-            scene.name = name
-        return {"index": index, "name": scene.name}
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error creating scene: " + str(e))
-        raise
+    if index < 0:
+        index = len(song.scenes)
+    song.create_scene(index)
+    # song.scenes is a snapshot, so it has to be re-read after the insert
+    scene = song.scenes[index]
+    if name:
+        scene.name = name
+    else:
+        name = scene.name
+    return {"index": index, "name": name}
 
 
+@log_errors("Error deleting scene")
 def delete_scene(song, scene_index, ctrl=None):
     """Delete a scene from the session."""
-    try:
-        scene = get_scene(song, scene_index)
-        scene_name = scene.name
-        song.delete_scene(scene_index)
-        return {
-            "deleted": True,
-            "scene_name": scene_name,
-            "scene_index": scene_index,
-        }
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error deleting scene: " + str(e))
-        raise
+    scene = get_scene(song, scene_index)
+    scene_name = scene.name
+    song.delete_scene(scene_index)
+    return {
+        "deleted": True,
+        "scene_name": scene_name,
+        "scene_index": scene_index,
+    }
 
 
+@log_errors("Error duplicating scene")
 def duplicate_scene(song, scene_index, ctrl=None):
     """Duplicate a scene."""
-    try:
-        get_scene(song, scene_index)
-        song.duplicate_scene(scene_index)
-        new_index = scene_index + 1
-        return {"new_index": new_index, "name": song.scenes[new_index].name}
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error duplicating scene: " + str(e))
-        raise
+    get_scene(song, scene_index)
+    song.duplicate_scene(scene_index)
+    new_index = scene_index + 1
+    # Re-read: a song.scenes fetched before the duplicate is stale, and
+    # Live may rename the copy, so the source name can't be echoed
+    return {"new_index": new_index, "name": song.scenes[new_index].name}
 
 
+@log_errors("Error firing scene")
 def fire_scene(song, scene_index, ctrl=None):
     """Fire (launch) a scene."""
-    try:
-        scene = get_scene(song, scene_index)
-        scene.fire()
-        return {"triggered": True, "scene_index": scene_index}
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error firing scene: " + str(e))
-        raise
+    scene = get_scene(song, scene_index)
+    scene.fire()
+    return {"triggered": True, "scene_index": scene_index}
 
 
+@log_errors("Error setting scene name")
 def set_scene_name(song, scene_index, name, ctrl=None):
     """Set a scene's name."""
-    try:
-        scene = get_scene(song, scene_index)
-        scene.name = name
-        return {"scene_index": scene_index, "name": name}
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error setting scene name: " + str(e))
-        raise
+    scene = get_scene(song, scene_index)
+    scene.name = name
+    return {"scene_index": scene_index, "name": name}
 
 
+@log_errors("Error getting scene follow actions")
 def get_scene_follow_actions(song, scene_index, ctrl=None):
     """Get follow action settings for a scene."""
+    scene = get_scene(song, scene_index)
     try:
-        scene = get_scene(song, scene_index)
-        result = {"scene_index": scene_index, "scene_name": scene.name}
-        for prop in ("follow_action_0", "follow_action_1",
-                      "follow_action_probability", "follow_action_time",
-                      "follow_action_enabled", "follow_action_linked"):
+        values = _FA_GETTER(scene)
+    except Exception:
+        # Older Live: fall back to reading each property on its own,
+        # reporting None for any this Live refuses
+        values = []
+        for prop in _FA_PROPS:
             try:
-                val = getattr(scene, prop)
-                if hasattr(val, 'value'):
-                    result[prop] = int(val)
-                elif isinstance(val, bool):
-                    result[prop] = val
-                elif isinstance(val, float):
-                    result[prop] = val
-                else:
-                    result[prop] = val
+                values.append(getattr(scene, prop))
             except Exception:
-                result[prop] = None
-        return result
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error getting scene follow actions: " + str(e))
-        raise
+                values.append(None)
+    exported = []
+    for val in values:
+        # Live enum wrappers (follow action types) expose .value; send them as ints
+        try:
+            exported.append(int(val) if hasattr(val, 'value') else val)
+        except Exception:
+            exported.append(None)
+    fa_0, fa_1, probability, fa_time, enabled, linked = exported
+    return {
+        "scene_index": scene_index,
+        "scene_name": scene.name,
+        "follow_action_0": fa_0,
+        "follow_action_1": fa_1,
+        "follow_action_probability": probability,
+        "follow_action_time": fa_time,
+        "follow_action_enabled": enabled,
+        "follow_action_linked": linked,
+    }
 
 
+@log_errors("Error setting scene follow actions")
 def set_scene_follow_actions(song, scene_index,
                               follow_action_0=None, follow_action_1=None,
                               follow_action_probability=None,
@@ -109,85 +169,91 @@ def set_scene_follow_actions(song, scene_index,
                               follow_action_enabled=None,
                               follow_action_linked=None, ctrl=None):
     """Set follow action settings for a scene."""
-    try:
-        scene = get_scene(song, scene_index)
-        changes = {}
-        if follow_action_0 is not None:
-            scene.follow_action_0 = int(follow_action_0)
-            changes["follow_action_0"] = int(follow_action_0)
-        if follow_action_1 is not None:
-            scene.follow_action_1 = int(follow_action_1)
-            changes["follow_action_1"] = int(follow_action_1)
-        if follow_action_probability is not None:
-            val = float(follow_action_probability)
-            scene.follow_action_probability = max(0.0, min(1.0, val))
-            changes["follow_action_probability"] = scene.follow_action_probability
-        if follow_action_time is not None:
-            scene.follow_action_time = float(follow_action_time)
-            changes["follow_action_time"] = float(follow_action_time)
-        if follow_action_enabled is not None:
-            scene.follow_action_enabled = bool(follow_action_enabled)
-            changes["follow_action_enabled"] = bool(follow_action_enabled)
-        if follow_action_linked is not None:
-            scene.follow_action_linked = bool(follow_action_linked)
-            changes["follow_action_linked"] = bool(follow_action_linked)
-        if not changes:
-            raise ValueError("No follow action parameters specified")
-        changes["scene_index"] = scene_index
-        changes["scene_name"] = scene.name
-        return changes
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error setting scene follow actions: " + str(e))
-        raise
+    scene = get_scene(song, scene_index)
+    values = (follow_action_0, follow_action_1, follow_action_probability,
+              follow_action_time, follow_action_enabled, follow_action_linked)
+    writes = _follow_action_writes(values)
+    if not writes:
+        raise ValueError("No follow action parameters specified")
+    for prop, val in writes:
+        setattr(scene, prop, val)
+    writes.append(("scene_index", scene_index))
+    writes.append(("scene_name", scene.name))
+    return dict(writes)
 
 
+@log_errors("Error firing scene as selected")
 def fire_scene_as_selected(song, scene_index, ctrl=None):
     """Fire a scene without moving the selection highlight."""
-    try:
-        scene = get_scene(song, scene_index)
-        scene.fire_as_selected()
-        return {"fired": True, "scene_index": scene_index}
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error firing scene as selected: " + str(e))
-        raise
+    scene = get_scene(song, scene_index)
+    scene.fire_as_selected()
+    return {"fired": True, "scene_index": scene_index}
 
 
-def set_scene_color(song, scene_index, color_index, ctrl=None):
-    """Set the color of a scene."""
-    try:
-        scene = get_scene(song, scene_index)
-        color_index = int(color_index)
-        if color_index < 0 or color_index > 69:
-            raise ValueError("color_index must be 0-69, got {0}".format(color_index))
-        scene.color_index = color_index
-        return {"scene_index": scene_index, "color_index": scene.color_index}
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error setting scene color: " + str(e))
-        raise
-
-
-def set_scene_tempo(song, scene_index, tempo, ctrl=None):
+@log_errors("Error setting scene color")
+def set_scene_color(song, scene_index, color_index, verify=False, ctrl=None):
+    """Set the color of a scene.
+
+    The written value is echoed back; pass verify=True to read it back from
+    Live instead.
+    """
+    scene = get_scene(song, scene_index)
+    color_index = _coerce_color(color_index)
+    scene.color_index = color_index
+    if verify:
+        color_index = scene.color_index
+    return {"scene_index": scene_index, "color_index": color_index}
+
+
+@log_errors("Error setting scene tempo")
+def set_scene_tempo(song, scene_index, tempo, verify=False, ctrl=None):
     """Set or clear a scene's tempo override.
 
     Args:
         tempo: BPM value (20-999), or 0 to clear the scene tempo override.
+        verify: Read the tempo (and scene name) back from Live instead of
+            echoing the written value.
     """
-    try:
-        scene = get_scene(song, scene_index)
-        tempo = float(tempo)
-        if tempo != 0 and (tempo < 20 or tempo > 999):
-            raise ValueError(
-                "Tempo must be 0 (to clear override) or between 20 and 999 BPM, got {0}".format(tempo))
-        scene.tempo = tempo
+    scene = get_scene(song, scene_index)
+    tempo = _coerce_tempo(tempo)
+    scene.tempo = tempo
+    if verify:
         return {
             "scene_index": scene_index,
             "tempo": scene.tempo,
             "name": scene.name,
         }
-    except Exception as e:
-        if ctrl:
-            ctrl.log_message("Error setting scene tempo: " + str(e))
-        raise
+    return {"scene_index": scene_index, "tempo": tempo}
+
+
+@log_errors("Error updating scene")
+def update_scene(song, scene_index, name=None, color_index=None, tempo=None,
+                 follow_actions=None, ctrl=None):
+    """Set several scene properties in one call.
+
+    Only the fields that are given are written.  follow_actions is a dict
+    keyed like set_scene_follow_actions' arguments.  The Python-side
+    checks on every value run before the first write; a Live setter can
+    still fail part-way, leaving the earlier fields written.
+    """
+    scene = get_scene(song, scene_index)
+    writes = []
+    if name is not None:
+        writes.append(("name", name))
+    if color_index is not None:
+        writes.append(("color_index", _coerce_color(color_index)))
+    if tempo is not None:
+        writes.append(("tempo", _coerce_tempo(tempo)))
+    if follow_actions:
+        unknown = set(follow_actions).difference(_FA_PROPS)
+        if unknown:
+            raise ValueError("Unknown follow action properties: {0}".format(
+                ", ".join(sorted(unknown))))
+        writes.extend(_follow_action_writes(
+            [follow_actions.get(prop) for prop in _FA_PROPS]))
+    if not writes:
+        raise ValueError("No scene properties specified")
+    for prop, val in writes:
+        setattr(scene, prop, val)
+    writes.append(("scene_index", scene_index))
+    return dict(writes)
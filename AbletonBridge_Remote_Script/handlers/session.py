@@ -2,7 +2,7 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from ._helpers import get_track, get_clip
+from ._helpers import get_track, get_clip_only
 
 
 def get_session_info(song, ctrl=None):
@@ -694,7 +694,7 @@ def set_detail_clip(song, track_index, clip_index, ctrl=None):
         clip_index: The clip slot index.
     """
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         song.view.detail_clip = clip
         return {
             "track_index": track_index,
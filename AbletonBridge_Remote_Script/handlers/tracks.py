@@ -2,7 +2,7 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
-from ._helpers import get_track, get_clip
+from ._helpers import get_track, get_tracks, get_clip_only
 
 
 def get_track_info(song, track_index, ctrl=None):
@@ -288,10 +288,8 @@ def group_tracks(song, track_indices, name, ctrl=None):
     """Group tracks — not supported by Remote Script API. Selects first track and returns guidance."""
     if not track_indices or len(track_indices) == 0:
         raise ValueError("No tracks specified")
-    for i in track_indices:
-        if i < 0 or i >= len(song.tracks):
-            raise IndexError("Track index {0} out of range".format(i))
-    song.view.selected_track = song.tracks[track_indices[0]]
+    tracks = get_tracks(song, track_indices)
+    song.view.selected_track = tracks[0]
     msg = ("Track grouping is not available via the Remote Script API. "
            "Select the tracks in Ableton and use Edit > Group Tracks (Ctrl+G / Cmd+G).")
     if ctrl:
@@ -432,7 +430,7 @@ def set_track_monitoring(song, track_index, state, ctrl=None):
 def create_midi_track_with_simpler(song, track_index, clip_index, ctrl=None):
     """Create a new MIDI track with a Simpler containing an audio clip's sample."""
     try:
-        _, clip = get_clip(song, track_index, clip_index)
+        clip = get_clip_only(song, track_index, clip_index)
         if not clip.is_audio_clip:
             raise ValueError("Clip is not an audio clip")
         try:
@@ -456,12 +454,10 @@ def get_track_meters(song, track_index=None, ctrl=None):
     try:
         tracks_data = []
         if track_index is not None:
-            get_track(song, track_index)  # validate bounds
-            indices = [track_index]
+            indexed_tracks = [(track_index, get_track(song, track_index))]
         else:
-            indices = range(len(song.tracks))
-        for i in indices:
-            track = song.tracks[i]
+            indexed_tracks = enumerate(song.tracks)
+        for i, track in indexed_tracks:
             info = {
                 "index": i,
                 "name": track.name,
@@ -796,12 +792,10 @@ def get_track_input_meters(song, track_index=None, ctrl=None):
     try:
         tracks_data = []
         if track_index is not None:
-            get_track(song, track_index)  # validate bounds
-            indices = [track_index]
+            indexed_tracks = [(track_index, get_track(song, track_index))]
         else:
-            indices = range(len(song.tracks))
-        for i in indices:
-            track = song.tracks[i]
+            indexed_tracks = enumerate(song.tracks)
+        for i, track in indexed_tracks:
             info = {"index": i, "name": track.name}
             try:
                 info["input_meter_left"] = round(track.input_meter_left, 4)
@@ -10,15 +10,20 @@ from MCP_Server.validation import _validate_index, _validate_range
 def register_tools(mcp):
     @mcp.tool()
     @_tool_handler("getting arrangement clips")
-    def get_arrangement_clips(ctx: Context, track_index: int) -> str:
+    def get_arrangement_clips(ctx: Context, track_index: int, compact: bool = False) -> str:
         """Get all clips in arrangement view for a track.
 
         Parameters:
         - track_index: The index of the track to get arrangement clips from
+        - compact: Return "clips" as one list per field (names, start times, ...)
+          instead of one object per clip; smaller for long arrangements (default: False)
         """
         _validate_index(track_index, "track_index")
         ableton = get_ableton_connection()
-        result = ableton.send_command("get_arrangement_clips", {"track_index": track_index})
+        params = {"track_index": track_index}
+        if compact:
+            params["compact"] = True
+        result = ableton.send_command("get_arrangement_clips", params)
         return json.dumps(result)
 
     @mcp.tool()
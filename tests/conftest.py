@@ -1,8 +1,53 @@
+import sys
+import types
+
 import pytest
 from unittest.mock import MagicMock, patch
 import MCP_Server.state as state
 
 
+def _install_framework_stub():
+    """Register a minimal ``_Framework`` so the Remote Script imports.
+
+    Inside Live the package is provided by the host; only the
+    ControlSurface methods the Remote Script calls are stood in for.
+    """
+    if "_Framework.ControlSurface" in sys.modules:
+        return
+    framework = types.ModuleType("_Framework")
+    control_surface = types.ModuleType("_Framework.ControlSurface")
+
+    class ControlSurface(object):
+        def __init__(self, c_instance):
+            pass
+
+        def log_message(self, message):
+            pass
+
+        def show_message(self, message):
+            pass
+
+        def schedule_message(self, delay, callback):
+            callback()
+
+        def song(self):
+            return None
+
+        def update_display(self):
+            pass
+
+        def disconnect(self):
+            pass
+
+    control_surface.ControlSurface = ControlSurface
+    framework.ControlSurface = control_surface
+    sys.modules["_Framework"] = framework
+    sys.modules["_Framework.ControlSurface"] = control_surface
+
+
+_install_framework_stub()
+
+
 @pytest.fixture
 def mock_ableton():
     """Mock AbletonConnection that returns success responses."""
@@ -55,3 +100,21 @@ def patch_m4l(mock_m4l):
     with patch.object(state, 'm4l_connection', mock_m4l):
         with patch('MCP_Server.connections.m4l.get_m4l_connection', return_value=mock_m4l):
             yield mock_m4l
+
+
+@pytest.fixture
+def remote_bridge():
+    """An AbletonBridge Remote Script instance with no sockets or I/O thread.
+
+    song() and schedule_message are mocks: scheduled callbacks are
+    collected on ``schedule_message.call_args_list`` rather than run.
+    """
+    import AbletonBridge_Remote_Script as rs
+    with patch.object(rs.AbletonBridge, "start_server"), \
+            patch.object(rs.AbletonBridge, "start_udp_server"), \
+            patch.object(rs.AbletonBridge, "start_io_thread"):
+        bridge = rs.AbletonBridge(MagicMock())
+    bridge.song = MagicMock()
+    bridge.schedule_message = MagicMock()
+    bridge.log_message = MagicMock()
+    return bridge
@@ -0,0 +1,105 @@
+"""Tests for get_arrangement_clips' compact mode, on both sides of the socket.
+
+The Remote Script handler is called with mocked Live objects; the MCP tool
+is called with a mocked Ableton connection.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from AbletonBridge_Remote_Script.handlers import arrangement
+
+
+# ---------------------------------------------------------------------------
+# get_arrangement_clips compact layout
+# ---------------------------------------------------------------------------
+
+def _song_with_clips(*clips):
+    track = MagicMock()
+    track.name = "Bass"
+    track.arrangement_clips = list(clips)
+    song = MagicMock()
+    song.tracks = [track]
+    return song
+
+
+def _clip(name, start, end):
+    clip = MagicMock()
+    clip.name = name
+    clip.start_time = start
+    clip.end_time = end
+    clip.length = end - start
+    clip.loop_start = 0.0
+    clip.loop_end = end - start
+    clip.is_audio_clip = False
+    clip.is_midi_clip = True
+    clip.muted = False
+    clip.color_index = 3
+    return clip
+
+
+class TestArrangementClipsCompact:
+    def test_columns_match_rows(self):
+        song = _song_with_clips(_clip("A", 0.0, 4.0), _clip("B", 8.0, 16.0))
+        rows = arrangement.get_arrangement_clips(song, 0)["clips"]
+        result = arrangement.get_arrangement_clips(song, 0, compact=True)
+        columns = result["clips"]
+        assert result["clip_count"] == 2
+        assert set(columns) == set(arrangement._CLIP_FIELDS)
+        for field in arrangement._CLIP_FIELDS:
+            assert columns[field] == [row[field] for row in rows]
+        assert columns["name"] == ["A", "B"]
+        assert columns["start_time"] == [0.0, 8.0]
+
+    def test_empty_track_has_every_column(self):
+        result = arrangement.get_arrangement_clips(_song_with_clips(), 0, compact=True)
+        assert result["clip_count"] == 0
+        assert result["clips"] == dict((field, []) for field in arrangement._CLIP_FIELDS)
+
+
+# ---------------------------------------------------------------------------
+# MCP tool: what get_arrangement_clips sends
+# ---------------------------------------------------------------------------
+
+# Module path for the import-time binding of get_ableton_connection
+_PATCH_GAC = 'MCP_Server.tools.arrangement.get_ableton_connection'
+
+
+def _register_arrangement_tools():
+    """Create a disposable FastMCP instance with arrangement tools registered."""
+    from mcp.server.fastmcp import FastMCP
+    from MCP_Server.tools.arrangement import register_tools
+    mcp = FastMCP("test")
+    register_tools(mcp)
+    return mcp
+
+
+def _get_tool(mcp, name):
+    """Retrieve a registered tool function by name."""
+    tool_fn = mcp._tool_manager._tools.get(name)
+    assert tool_fn is not None, f"Tool '{name}' was not registered"
+    return tool_fn
+
+
+class TestGetArrangementClips:
+
+    @pytest.mark.asyncio
+    async def test_compact_omitted_by_default(self, patch_ableton):
+        """Without compact, the command carries only the track index."""
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            tool_fn = _get_tool(_register_arrangement_tools(), "get_arrangement_clips")
+            patch_ableton.send_command.return_value = {"clips": []}
+            await tool_fn.fn(MagicMock(), track_index=2)
+
+        patch_ableton.send_command.assert_called_once_with(
+            "get_arrangement_clips", {"track_index": 2})
+
+    @pytest.mark.asyncio
+    async def test_compact_sent_when_set(self, patch_ableton):
+        with patch(_PATCH_GAC, return_value=patch_ableton):
+            tool_fn = _get_tool(_register_arrangement_tools(), "get_arrangement_clips")
+            patch_ableton.send_command.return_value = {"clips": {}}
+            await tool_fn.fn(MagicMock(), track_index=2, compact=True)
+
+        patch_ableton.send_command.assert_called_once_with(
+            "get_arrangement_clips", {"track_index": 2, "compact": True})
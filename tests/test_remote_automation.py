@@ -0,0 +1,60 @@
+"""Tests for the automation handlers' breakpoint preparation and clamping."""
+
+from unittest.mock import MagicMock, patch
+
+from AbletonBridge_Remote_Script.handlers import automation
+from AbletonBridge_Remote_Script.handlers.automation import _breakpoints
+
+
+class TestBreakpoints:
+    def test_sorted_by_time(self):
+        points = [{"time": 2.0, "value": 0.2}, {"time": 0.0, "value": 0.0},
+                  {"time": 1.0, "value": 0.1}]
+        assert _breakpoints(points, 0.0, 4.0, 0.0, 1.0) == [
+            (0.0, 0.0), (1.0, 0.1), (2.0, 0.2)]
+
+    def test_duplicate_time_keeps_last_value(self):
+        points = [{"time": 1.0, "value": 0.2}, {"time": 1.0, "value": 0.8}]
+        assert _breakpoints(points, 0.0, 4.0, 0.0, 1.0) == [(1.0, 0.8)]
+
+    def test_times_equal_after_clamping_are_merged(self):
+        points = [{"time": 5.0, "value": 0.3}, {"time": 9.0, "value": 0.6}]
+        assert _breakpoints(points, 0.0, 4.0, 0.0, 1.0) == [(4.0, 0.6)]
+
+    def test_values_clamped(self):
+        points = [{"time": 0.0, "value": -1.0}, {"time": 1.0, "value": 2.0}]
+        assert _breakpoints(points, 0.0, 4.0, 0.0, 1.0) == [(0.0, 0.0), (1.0, 1.0)]
+
+    def test_nan_goes_to_lower_bound(self):
+        points = [{"time": float("nan"), "value": float("nan")}]
+        assert _breakpoints(points, 0.0, 4.0, 0.25, 1.0) == [(0.0, 0.25)]
+
+    def test_empty_time_range_clamps_to_lower_bound(self):
+        """A clip shorter than the end margin gives t_max < t_min; as with
+        max(t_min, min(t_max, t)) the time lands on t_min, never below it."""
+        points = [{"time": 0.0, "value": 0.5}, {"time": 3.0, "value": 0.7}]
+        assert _breakpoints(points, 0.0, -0.001, 0.0, 1.0) == [(0.0, 0.7)]
+
+
+class TestCreateStepAutomation:
+    def _run(self, clip_length, steps):
+        clip = MagicMock()
+        clip.length = clip_length
+        param = MagicMock()
+        param.min, param.max = 0.0, 1.0
+        with patch.object(automation, "get_clip", return_value=(MagicMock(), clip)), \
+                patch.object(automation, "_find_parameter", return_value=param):
+            automation.create_step_automation(None, 0, 0, "Cutoff", steps)
+        envelope = clip.automation_envelope.return_value
+        return [c.args for c in envelope.insert_step.call_args_list]
+
+    def test_steps_clamped_into_clip(self):
+        inserted = self._run(4.0, [
+            {"time": -1.0, "value": 2.0, "duration": 1.0},
+            {"time": 3.5, "value": 0.5, "duration": 2.0},
+        ])
+        assert inserted == [(0.0, 1.0, 1.0), (3.5, 0.5, 0.5)]
+
+    def test_clip_shorter_than_margin_never_gets_negative_time(self):
+        inserted = self._run(0.0005, [{"time": 0.0, "value": 0.5, "duration": 1.0}])
+        assert inserted == [(0.0, 0.0005, 0.5)]
@@ -0,0 +1,109 @@
+"""Tests for the Remote Script's encoded-response cache (_CACHED_READS).
+
+Commands go through _encoded_response with handlers patched out;
+schedule_message runs its callback at once, standing in for Live's
+main-thread tick.
+"""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+import AbletonBridge_Remote_Script as rs
+
+_SEARCH = {"type": "search_browser", "params": {"query": "kick", "category": "all"}}
+
+
+@pytest.fixture
+def bridge(remote_bridge):
+    remote_bridge.schedule_message.side_effect = lambda delay, callback: callback()
+    return remote_bridge
+
+
+@pytest.fixture
+def search():
+    with patch.object(rs.handlers.browser, "search_browser",
+                      return_value={"results": ["Kick 1"]}) as handler:
+        yield handler
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch.object(rs, "_monotonic", lambda: now[0]):
+        yield now
+
+
+class TestResponseCache:
+    def test_repeat_read_served_from_cache(self, bridge, search, clock):
+        first = bridge._encoded_response(_SEARCH)
+        second = bridge._encoded_response(_SEARCH)
+        assert second is first
+        assert search.call_count == 1
+        assert json.loads(first) == {"status": "success", "result": {"results": ["Kick 1"]}}
+
+    def test_key_includes_the_params(self, bridge, search, clock):
+        bridge._encoded_response(_SEARCH)
+        bridge._encoded_response({"type": "search_browser",
+                                  "params": {"query": "snare", "category": "all"}})
+        assert search.call_count == 2
+
+    def test_modifying_command_invalidates(self, bridge, search, clock):
+        bridge._encoded_response(_SEARCH)
+        with patch.object(rs.handlers.session, "set_tempo", return_value={"tempo": 90.0}):
+            bridge._encoded_response({"type": "set_tempo", "params": {"tempo": 90.0}})
+        bridge._encoded_response(_SEARCH)
+        assert search.call_count == 2
+
+    def test_read_only_command_does_not_invalidate(self, bridge, search, clock):
+        bridge._encoded_response(_SEARCH)
+        with patch.object(rs.handlers.session, "get_song_transport", return_value={}):
+            bridge._encoded_response({"type": "get_song_transport", "params": {}})
+        bridge._encoded_response(_SEARCH)
+        assert search.call_count == 1
+
+    def test_entry_expires_after_ttl(self, bridge, search, clock):
+        bridge._encoded_response(_SEARCH)
+        clock[0] += rs.RESPONSE_CACHE_TTL - 0.1
+        bridge._encoded_response(_SEARCH)
+        assert search.call_count == 1
+        clock[0] += 0.2
+        bridge._encoded_response(_SEARCH)
+        assert search.call_count == 2
+
+    def test_errors_are_not_cached(self, bridge, clock):
+        with patch.object(rs.handlers.browser, "search_browser",
+                          side_effect=ValueError("Invalid browser category")) as handler:
+            bridge._encoded_response(_SEARCH)
+            bridge._encoded_response(_SEARCH)
+        assert handler.call_count == 2
+        assert bridge._response_cache == {}
+
+    def test_uncached_command_bypasses_cache(self, bridge, clock):
+        with patch.object(rs.handlers.session, "get_song_transport", return_value={}) as handler:
+            bridge._encoded_response({"type": "get_song_transport", "params": {}})
+        assert handler.call_count == 1
+        assert bridge._response_cache == {}
+
+    def test_cache_bounded(self, bridge, search, clock):
+        for i in range(rs.RESPONSE_CACHE_MAX + 1):
+            bridge._encoded_response({"type": "search_browser",
+                                      "params": {"query": str(i), "category": "all"}})
+        assert len(bridge._response_cache) <= rs.RESPONSE_CACHE_MAX
+
+
+class TestResponseCacheKey:
+    def test_unhashable_param_is_not_cached(self):
+        assert rs._response_cache_key(
+            {"type": "search_browser", "params": {"query": ["kick"]}}) is None
+
+    def test_params_not_a_dict(self):
+        assert rs._response_cache_key({"type": "search_browser", "params": []}) is None
+
+    def test_key_ignores_unlisted_params(self):
+        a = rs._response_cache_key({"type": "get_browser_items_at_path",
+                                    "params": {"path": "drums", "extra": 1}})
+        b = rs._response_cache_key({"type": "get_browser_items_at_path",
+                                    "params": {"path": "drums"}})
+        assert a == b == ("get_browser_items_at_path", "drums")
@@ -0,0 +1,23 @@
+"""Tests for the shared handler helpers in AbletonBridge_Remote_Script/handlers/_helpers.py."""
+
+import pytest
+
+from AbletonBridge_Remote_Script.handlers._helpers import file_name
+
+
+class TestFileName:
+    @pytest.mark.parametrize("path", [None, ""])
+    def test_empty(self, path):
+        assert file_name(path) is None
+
+    def test_posix(self):
+        assert file_name("/Users/me/Samples/kick.wav") == "kick.wav"
+
+    def test_windows(self):
+        assert file_name("C:\\Samples\\Drums\\snare.aif") == "snare.aif"
+
+    def test_mixed_separators(self):
+        assert file_name("C:\\Samples/Drums\\hat.wav") == "hat.wav"
+
+    def test_bare_name(self):
+        assert file_name("clap.wav") == "clap.wav"
@@ -0,0 +1,45 @@
+"""Tests for the Remote Script's up-front parameter checks (_validate_params)."""
+
+import AbletonBridge_Remote_Script as rs
+
+
+class TestValidateParams:
+    SCHEMA = rs._PARAM_SCHEMAS["add_notes_to_clip"]
+
+    def test_valid(self):
+        assert rs._validate_params(self.SCHEMA, {
+            "track_index": 0, "clip_index": 1, "notes": []}) is None
+
+    def test_missing_keys_are_left_to_the_handler(self):
+        assert rs._validate_params(self.SCHEMA, {}) is None
+
+    def test_none_is_allowed(self):
+        assert rs._validate_params(self.SCHEMA, {"notes": None}) is None
+
+    def test_params_not_a_dict(self):
+        assert rs._validate_params(self.SCHEMA, []) == "Invalid params: expected an object"
+
+    def test_wrong_list_type(self):
+        msg = rs._validate_params(self.SCHEMA, {"notes": "C4"})
+        assert msg == "Invalid parameter 'notes': expected a list"
+
+    def test_wrong_integer_type(self):
+        msg = rs._validate_params(self.SCHEMA, {"track_index": "0"})
+        assert msg == "Invalid parameter 'track_index': expected an integer"
+
+
+class TestProcessCommandRejects:
+    def test_malformed_payload_is_not_queued(self, remote_bridge):
+        response = remote_bridge._process_command({
+            "type": "add_notes_to_clip",
+            "params": {"track_index": 0, "clip_index": 0, "notes": "C4"},
+        })
+        assert response == {"status": "error",
+                            "message": "Invalid parameter 'notes': expected a list"}
+        assert not remote_bridge._pending_tasks
+        remote_bridge.schedule_message.assert_not_called()
+
+    def test_params_not_an_object(self, remote_bridge):
+        response = remote_bridge._process_command({"type": "group_tracks", "params": [0, 1]})
+        assert response["status"] == "error"
+        assert not remote_bridge._pending_tasks
@@ -0,0 +1,69 @@
+"""Tests for the Remote Script's update_scene handler."""
+
+import pytest
+
+from AbletonBridge_Remote_Script.handlers import scenes
+
+
+class _Scene(object):
+    """A scene that records every property written to it."""
+
+    def __init__(self):
+        self.__dict__["writes"] = []
+        self.__dict__["name"] = "Intro"
+
+    def __setattr__(self, prop, value):
+        self.writes.append((prop, value))
+        self.__dict__[prop] = value
+
+
+class _Song(object):
+    def __init__(self, count=2):
+        self.scenes = [_Scene() for _ in range(count)]
+
+
+class TestUpdateScene:
+    def test_only_given_fields_are_written(self):
+        song = _Song()
+        result = scenes.update_scene(song, 1, name="Drop", tempo=128)
+        assert song.scenes[1].writes == [("name", "Drop"), ("tempo", 128.0)]
+        assert song.scenes[0].writes == []
+        assert result == {"scene_index": 1, "name": "Drop", "tempo": 128.0}
+
+    def test_color_and_follow_actions(self):
+        song = _Song()
+        result = scenes.update_scene(song, 0, color_index="12", follow_actions={
+            "follow_action_probability": 1.5, "follow_action_enabled": 1})
+        assert song.scenes[0].writes == [
+            ("color_index", 12),
+            ("follow_action_probability", 1.0),
+            ("follow_action_enabled", True),
+        ]
+        assert result["follow_action_probability"] == 1.0
+
+    def test_zero_tempo_clears_override(self):
+        song = _Song()
+        scenes.update_scene(song, 0, tempo=0)
+        assert song.scenes[0].writes == [("tempo", 0.0)]
+
+    @pytest.mark.parametrize("kwargs, message", [
+        ({"name": "Drop", "color_index": 70}, "color_index must be 0-69, got 70"),
+        ({"name": "Drop", "tempo": 10},
+         "Tempo must be 0 (to clear override) or between 20 and 999 BPM, got 10.0"),
+        ({"name": "Drop", "follow_actions": {"follow_action_3": 1}},
+         "Unknown follow action properties: follow_action_3"),
+    ])
+    def test_bad_value_rejected_before_any_write(self, kwargs, message):
+        song = _Song()
+        with pytest.raises(ValueError) as excinfo:
+            scenes.update_scene(song, 0, **kwargs)
+        assert str(excinfo.value) == message
+        assert song.scenes[0].writes == []
+
+    def test_nothing_to_set(self):
+        with pytest.raises(ValueError, match="No scene properties specified"):
+            scenes.update_scene(_Song(), 0)
+
+    def test_scene_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            scenes.update_scene(_Song(), 5, name="Drop")
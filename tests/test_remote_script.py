@@ -0,0 +1,151 @@
+"""Tests for the Ableton Remote Script's command queue.
+
+The Remote Script is imported against the ``_Framework`` stand-in from
+conftest.py; handlers are replaced by plain functions, so no Live API is
+touched.
+"""
+
+import threading
+import time
+
+import AbletonBridge_Remote_Script as rs
+
+
+# ---------------------------------------------------------------------------
+# _coalesce_key
+# ---------------------------------------------------------------------------
+
+class TestCoalesceKey:
+    def test_not_coalescable(self):
+        assert rs._coalesce_key("get_session_info", None, {}) is None
+
+    def test_key_from_target_params(self):
+        key = rs._coalesce_key("set_track_send", ("track_index", "send_index"),
+                               {"track_index": 2, "send_index": 1, "value": 0.5})
+        assert key == ("set_track_send", 2, 1)
+
+    def test_value_does_not_change_key(self):
+        names = rs._COALESCE_TARGETS["set_track_volume"]
+        a = rs._coalesce_key("set_track_volume", names, {"track_index": 0, "volume": 0.1})
+        b = rs._coalesce_key("set_track_volume", names, {"track_index": 0, "volume": 0.9})
+        assert a == b
+
+    def test_different_targets_differ(self):
+        names = rs._COALESCE_TARGETS["set_track_volume"]
+        a = rs._coalesce_key("set_track_volume", names, {"track_index": 0})
+        b = rs._coalesce_key("set_track_volume", names, {"track_index": 1})
+        assert a != b
+
+    def test_unhashable_target_is_not_coalesced(self):
+        assert rs._coalesce_key("set_track_volume", ("track_index",),
+                                {"track_index": [0]}) is None
+
+
+# ---------------------------------------------------------------------------
+# _drain_pending_tasks: superseded writes
+# ---------------------------------------------------------------------------
+
+def _queue(bridge, key, ran, replies, label, response=None):
+    """Queue a task that records it ran and returns *response*."""
+    def task(song):
+        ran.append(label)
+        return response
+
+    bridge._pending_tasks.append((
+        task,
+        lambda response=rs._SCHEDULING_UNAVAILABLE: replies.append((label, response)),
+        key,
+    ))
+
+
+def _entry(handler):
+    """A _DISPATCH-style entry for a quick modifying command."""
+    return (handler, True, False, (), None, False, 5.0)
+
+
+def _dispatch_in_thread(bridge, entry, params, key, results):
+    """Call _dispatch_on_main_thread from a socket-like thread and wait
+    until its task is queued."""
+    queued = len(bridge._pending_tasks) + 1
+    thread = threading.Thread(target=lambda: results.append(
+        bridge._dispatch_on_main_thread(entry, params, key)))
+    thread.start()
+    while len(bridge._pending_tasks) < queued:
+        time.sleep(0.001)
+    return thread
+
+
+class TestDrainCoalescing:
+    def test_earlier_write_to_same_target_gets_the_later_response(self, remote_bridge):
+        ran, replies = [], []
+        later = {"status": "success", "result": {"value": 2}}
+        _queue(remote_bridge, ("set_tempo",), ran, replies, "first")
+        _queue(remote_bridge, ("set_tempo",), ran, replies, "second", later)
+        remote_bridge._drain_pending_tasks()
+        assert ran == ["second"]
+        assert replies == [("first", later)]
+
+    def test_run_of_superseded_writes_share_the_last_response(self, remote_bridge):
+        ran, replies = [], []
+        last = {"status": "success", "result": {"value": 3}}
+        for label in ("a", "b"):
+            _queue(remote_bridge, ("set_tempo",), ran, replies, label)
+        _queue(remote_bridge, ("set_tempo",), ran, replies, "c", last)
+        remote_bridge._drain_pending_tasks()
+        assert ran == ["c"]
+        assert replies == [("a", last), ("b", last)]
+
+    def test_interleaved_command_prevents_skip(self, remote_bridge):
+        ran, replies = [], []
+        _queue(remote_bridge, ("set_tempo",), ran, replies, "a")
+        _queue(remote_bridge, None, ran, replies, "b")
+        _queue(remote_bridge, ("set_tempo",), ran, replies, "c")
+        remote_bridge._drain_pending_tasks()
+        assert ran == ["a", "b", "c"]
+        assert replies == []
+
+    def test_different_targets_all_run(self, remote_bridge):
+        ran, replies = [], []
+        _queue(remote_bridge, ("set_track_volume", 0), ran, replies, "t0")
+        _queue(remote_bridge, ("set_track_volume", 1), ran, replies, "t1")
+        remote_bridge._drain_pending_tasks()
+        assert ran == ["t0", "t1"]
+
+    def test_superseded_caller_sees_the_value_written(self, remote_bridge):
+        """Both callers get the response of the write that ran."""
+        written = []
+
+        def handler(song, p, ctrl):
+            written.append(p["value"])
+            return {"parameter": "Cutoff", "value": p["value"]}
+
+        key = ("set_device_parameter", "track", 0, 0, "Cutoff")
+        results = []
+        threads = [
+            _dispatch_in_thread(remote_bridge, _entry(handler), {"value": 0.25}, key, results),
+            _dispatch_in_thread(remote_bridge, _entry(handler), {"value": 0.75}, key, results),
+        ]
+        remote_bridge._drain_pending_tasks()
+        for thread in threads:
+            thread.join(5.0)
+        assert written == [0.75]
+        assert results == [{"status": "success",
+                            "result": {"parameter": "Cutoff", "value": 0.75}}] * 2
+
+    def test_superseded_caller_sees_the_error(self, remote_bridge):
+        """A write that fails fails for the superseded caller too."""
+        def handler(song, p, ctrl):
+            raise ValueError("Parameter 'Cutof' not found")
+
+        key = ("set_device_parameter", "track", 0, 0, "Cutof")
+        results = []
+        threads = [
+            _dispatch_in_thread(remote_bridge, _entry(handler), {"value": 0.25}, key, results),
+            _dispatch_in_thread(remote_bridge, _entry(handler), {"value": 0.75}, key, results),
+        ]
+        remote_bridge._drain_pending_tasks()
+        for thread in threads:
+            thread.join(5.0)
+        assert len(results) == 2
+        assert all(r["status"] == "error" for r in results)
+        assert results[0] is results[1]
@@ -0,0 +1,89 @@
+"""Tests for the Remote Script's polled-read snapshots (_SNAPSHOT_COMMANDS).
+
+A snapshot is refreshed on update_display and used only while it is
+younger than SNAPSHOT_MAX_AGE and no modifying command has run since.
+"""
+
+import pytest
+from unittest.mock import patch
+
+import AbletonBridge_Remote_Script as rs
+
+_TRANSPORT = {"type": "get_song_transport", "params": {}}
+
+
+@pytest.fixture
+def bridge(remote_bridge):
+    remote_bridge.schedule_message.side_effect = lambda delay, callback: callback()
+    return remote_bridge
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch.object(rs, "_monotonic", lambda: now[0]):
+        yield now
+
+
+@pytest.fixture
+def transport():
+    state = {"is_playing": False}
+    with patch.object(rs.handlers.session, "get_song_transport",
+                      side_effect=lambda song, ctrl=None: dict(state)) as handler:
+        handler.state = state
+        yield handler
+
+
+class TestSnapshots:
+    def test_first_read_runs_the_handler(self, bridge, clock, transport):
+        response = bridge._process_command(_TRANSPORT)
+        assert response == {"status": "success", "result": {"is_playing": False}}
+        assert transport.call_count == 1
+        assert "get_song_transport" in bridge._snapshot_requests
+
+    def test_read_after_refresh_uses_the_snapshot(self, bridge, clock, transport):
+        bridge._process_command(_TRANSPORT)
+        transport.state["is_playing"] = True
+        bridge.update_display()
+        calls = transport.call_count
+        response = bridge._process_command(_TRANSPORT)
+        assert response["result"] == {"is_playing": True}
+        assert transport.call_count == calls
+
+    def test_modifying_command_makes_snapshot_stale(self, bridge, clock, transport):
+        bridge._process_command(_TRANSPORT)
+        bridge.update_display()
+        with patch.object(rs.handlers.session, "start_playback", return_value={}):
+            bridge._process_command({"type": "start_playback", "params": {}})
+        calls = transport.call_count
+        bridge._process_command(_TRANSPORT)
+        assert transport.call_count == calls + 1
+
+    def test_snapshot_older_than_max_age_is_not_used(self, bridge, clock, transport):
+        bridge._process_command(_TRANSPORT)
+        bridge.update_display()
+        clock[0] += rs.SNAPSHOT_MAX_AGE + 0.01
+        calls = transport.call_count
+        bridge._process_command(_TRANSPORT)
+        assert transport.call_count == calls + 1
+
+    def test_refresh_stops_once_nobody_polls(self, bridge, clock, transport):
+        bridge._process_command(_TRANSPORT)
+        bridge.update_display()
+        clock[0] += rs.SNAPSHOT_IDLE + 0.01
+        calls = transport.call_count
+        bridge.update_display()
+        assert transport.call_count == calls
+        assert bridge._snapshot_requests == {}
+        assert bridge._snapshots == {}
+
+    def test_failed_refresh_drops_the_snapshot(self, bridge, clock, transport):
+        bridge._process_command(_TRANSPORT)
+        bridge.update_display()
+        transport.side_effect = RuntimeError("song unavailable")
+        bridge.update_display()
+        assert "get_song_transport" not in bridge._snapshots
+
+    def test_no_polled_reads_no_refresh(self, bridge, clock, transport):
+        bridge.update_display()
+        assert transport.call_count == 0
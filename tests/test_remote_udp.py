@@ -0,0 +1,182 @@
+"""Tests for the Remote Script's UDP parameter path.
+
+Packets are merged per device and parameter on the I/O thread
+(_process_udp_command) and applied by one scheduled main-thread flush
+(_flush_udp_params -> devices.apply_parameter_values).
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from AbletonBridge_Remote_Script.handlers import devices
+
+
+def _set(name, value, track_index=0, device_index=0):
+    return {"type": "set_device_parameter", "params": {
+        "track_index": track_index, "device_index": device_index,
+        "parameter_name": name, "value": value}}
+
+
+def _batch(parameters, track_index=0, device_index=0):
+    return {"type": "batch_set_device_parameters", "params": {
+        "track_index": track_index, "device_index": device_index,
+        "parameters": parameters}}
+
+
+class _Param(object):
+    def __init__(self, name, min=0.0, max=1.0, is_quantized=False):
+        self.name = name
+        self.min = min
+        self.max = max
+        self.value = min
+        self.is_quantized = is_quantized
+
+
+# ---------------------------------------------------------------------------
+# _process_udp_command: merging on the I/O thread
+# ---------------------------------------------------------------------------
+
+class TestMerge:
+    def test_later_value_for_same_parameter_wins(self, remote_bridge):
+        for value in (0.1, 0.2, 0.3):
+            remote_bridge._process_udp_command(_set("Cutoff", value))
+        assert remote_bridge._udp_pending == {
+            ("track", 0, 0): {"Cutoff": {"name": "Cutoff", "value": 0.3}}}
+
+    def test_one_flush_scheduled_for_many_packets(self, remote_bridge):
+        for value in (0.1, 0.2):
+            remote_bridge._process_udp_command(_set("Cutoff", value))
+        remote_bridge._process_udp_command(_set("Gain", 0.5, device_index=1))
+        remote_bridge.schedule_message.assert_called_once_with(
+            0, remote_bridge._flush_udp_params)
+
+    def test_batch_and_single_merge_by_name(self, remote_bridge):
+        remote_bridge._process_udp_command(_batch([
+            {"name": "Cutoff", "value": 0.1}, {"name": "Res", "value": 0.4}]))
+        remote_bridge._process_udp_command(_set("Cutoff", 0.9))
+        pending = remote_bridge._udp_pending[("track", 0, 0)]
+        assert pending == {"Cutoff": {"name": "Cutoff", "value": 0.9},
+                           "Res": {"name": "Res", "value": 0.4}}
+
+    def test_devices_kept_apart(self, remote_bridge):
+        remote_bridge._process_udp_command(_set("Cutoff", 0.1, track_index=0))
+        remote_bridge._process_udp_command(_set("Cutoff", 0.2, track_index=1))
+        assert set(remote_bridge._udp_pending) == {("track", 0, 0), ("track", 1, 0)}
+
+    def test_other_commands_ignored(self, remote_bridge):
+        remote_bridge._process_udp_command({"type": "set_tempo", "params": {"tempo": 90}})
+        assert remote_bridge._udp_pending == {}
+        remote_bridge.schedule_message.assert_not_called()
+
+    def test_schedule_failure_drops_pending(self, remote_bridge):
+        remote_bridge.schedule_message.side_effect = AssertionError
+        remote_bridge._process_udp_command(_set("Cutoff", 0.1))
+        assert remote_bridge._udp_pending == {}
+        assert remote_bridge._udp_flush_scheduled is False
+
+
+class TestMalformedPackets:
+    @pytest.mark.parametrize("command", [
+        {"type": "batch_set_device_parameters", "params": [1, 2]},
+        _batch(5),
+        _batch([{"name": "Cutoff", "value": 0.1}, 7]),
+        _batch([{"name": ["Cutoff"], "value": 0.1}]),
+        _set("Cutoff", 0.1, device_index=[0]),
+    ])
+    def test_dropped_without_touching_pending(self, remote_bridge, command):
+        remote_bridge._process_udp_command(_set("Gain", 0.5))
+        before = {key: dict(entries) for key, entries in remote_bridge._udp_pending.items()}
+        remote_bridge._process_udp_command(command)
+        assert remote_bridge._udp_pending == before
+        # The earlier update's flush is still the only one scheduled
+        assert remote_bridge.schedule_message.call_count == 1
+        assert remote_bridge._udp_flush_scheduled is True
+
+
+# ---------------------------------------------------------------------------
+# _flush_udp_params: the main-thread swap
+# ---------------------------------------------------------------------------
+
+class TestFlush:
+    def test_swaps_pending_out_and_applies_per_device(self, remote_bridge):
+        remote_bridge._process_udp_command(_set("Cutoff", 0.1))
+        remote_bridge._process_udp_command(_set("Cutoff", 0.7))
+        remote_bridge._process_udp_command(_set("Gain", 0.5, track_index=2))
+        with patch.object(devices, "apply_parameter_values") as apply:
+            remote_bridge._flush_udp_params()
+        assert remote_bridge._udp_pending == {}
+        assert remote_bridge._udp_flush_scheduled is False
+        applied = dict(((c.args[1], c.args[2]), list(c.args[3])) for c in apply.call_args_list)
+        assert applied == {
+            (0, 0): [{"name": "Cutoff", "value": 0.7}],
+            (2, 0): [{"name": "Gain", "value": 0.5}],
+        }
+
+    def test_packet_after_flush_schedules_again(self, remote_bridge):
+        remote_bridge._process_udp_command(_set("Cutoff", 0.1))
+        with patch.object(devices, "apply_parameter_values"):
+            remote_bridge._flush_udp_params()
+        remote_bridge._process_udp_command(_set("Cutoff", 0.2))
+        assert remote_bridge.schedule_message.call_count == 2
+
+    def test_device_failure_does_not_stop_other_devices(self, remote_bridge):
+        remote_bridge._process_udp_command(_set("Cutoff", 0.1, track_index=0))
+        remote_bridge._process_udp_command(_set("Cutoff", 0.2, track_index=1))
+        calls = []
+
+        def apply(song, track_index, *args, **kwargs):
+            calls.append(track_index)
+            if track_index == 0:
+                raise IndexError("Device index out of range")
+
+        with patch.object(devices, "apply_parameter_values", side_effect=apply):
+            remote_bridge._flush_udp_params()
+        assert sorted(calls) == [0, 1]
+
+
+# ---------------------------------------------------------------------------
+# devices.apply_parameter_values
+# ---------------------------------------------------------------------------
+
+def _apply(params, entries):
+    device = MagicMock()
+    device.parameters = params
+    ctrl = MagicMock()
+    with patch.object(devices, "_resolve_device", return_value=(MagicMock(), device)):
+        written = devices.apply_parameter_values(None, 0, 0, entries, ctrl=ctrl)
+    return written, ctrl
+
+
+class TestApplyParameterValues:
+    def test_first_parameter_with_the_name_is_written(self):
+        first, second = _Param("Gain"), _Param("Gain")
+        written, _ = _apply([first, second], [{"name": "Gain", "value": 0.6}])
+        assert written == 1
+        assert (first.value, second.value) == (0.6, 0.0)
+
+    def test_missing_value_is_skipped_not_zeroed(self):
+        cutoff = _Param("Cutoff", min=20.0, max=20000.0)
+        cutoff.value = 440.0
+        written, ctrl = _apply([cutoff], [{"name": "Cutoff"}])
+        assert written == 0
+        assert cutoff.value == 440.0
+        assert "missing value or value_display" in ctrl.log_message.call_args[0][0]
+
+    def test_bad_entry_does_not_stop_the_rest(self):
+        res, gain = _Param("Res"), _Param("Gain")
+        written, ctrl = _apply([res, gain], [
+            {"name": "Res", "value": "loud"},
+            {"name": "Nope", "value": 0.1},
+            {"name": "Gain", "value": 0.4},
+        ])
+        assert written == 1
+        assert gain.value == 0.4
+        assert ctrl.log_message.call_count == 2
+
+    def test_value_clamped_and_quantized(self):
+        steps = _Param("Mode", min=0, max=3, is_quantized=True)
+        level = _Param("Level")
+        _apply([steps, level], [{"name": "Mode", "value": 1.6},
+                                {"name": "Level", "value": 4.0}])
+        assert steps.value == 2
+        assert level.value == 1.0